@@ -0,0 +1,178 @@
+# ================== ATLAS DE SPRITES PRECOMPILADOS ==================
+# Archivo separado con el formato de atlas en disco y el comando para hornearlos
+# Un atlas guarda los frames de un GIF ya decodificados, escalados y en RGBA,
+# para que el juego solo tenga que mapearlos en memoria al iniciar
+#
+# FORMATO DEL ATLAS (junto al GIF original):
+# - <gif>.<ancho>x<alto>.atlas       -> hoja RGBA cruda, frames apilados en vertical
+# - <gif>.<ancho>x<alto>.atlas.json  -> índice con rects, duraciones y datos de la fuente
+#
+# USO: python atlas.py            (hornea todos los GIFs del juego)
+#      python atlas.py --biomas   (también los fondos de bioma, ver ATLAS_BIOMAS)
+#      python atlas.py --limpiar  (borra los atlas generados)
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+
+import pygame
+from PIL import Image
+
+VERSION_ATLAS = 3  # 3: frames escalados en PIL con recursos.FILTRO_ESCALADO
+
+# GIFs y tamaños que usa el juego: (patrón de carpeta o archivo, tamaños)
+# Deben coincidir con los tamaños pedidos a load_gif_frames en jugar.py y menu.py
+ATLAS_A_HORNEAR = [
+    ("apus", [(160, 160)]),                  # TAMANO_APU
+    ("illas", [(50, 50), (40, 40)]),         # TAMANO_ILLA y tamaño en la mochila
+    ("ekeko.gif", [(27, 59), (120, 120)]),   # Jugador (escala 0.1) y menú
+]
+
+# Fondos de bioma a pantalla completa: solo se leen con FONDOS_EN_STREAMING y
+# FONDOS_EN_PALETA en False (el streaming y la paleta no usan atlas), y ocupan
+# cientos de MB en disco, así que se hornean solo si se piden con --biomas
+ATLAS_BIOMAS = [("biomas", [(800, 600)])]
+
+
+def rutas_atlas(gif_path, size=None):
+    """Retorna las rutas (hoja, índice) del atlas de un GIF para un tamaño"""
+    sufijo = f"{size[0]}x{size[1]}" if size else "original"
+    base = f"{gif_path}.{sufijo}.atlas"
+    return base, base + ".json"
+
+
+def _sha1_archivo(ruta):
+    """Calcula el hash SHA-1 de un archivo"""
+    sha1 = hashlib.sha1()
+    with open(ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(1 << 16), b""):
+            sha1.update(bloque)
+    return sha1.hexdigest()
+
+
+def _datos_fuente(gif_path):
+    """Datos del GIF original usados para detectar atlas desactualizados"""
+    estado = os.stat(gif_path)
+    return {"mtime_ns": estado.st_mtime_ns, "bytes": estado.st_size}
+
+
+def atlas_vigente(gif_path, indice):
+    """True si el atlas corresponde al GIF actual (por mtime o, si cambió, por hash)"""
+    if indice.get("version") != VERSION_ATLAS:
+        return False
+    fuente = indice.get("fuente", {})
+    actual = _datos_fuente(gif_path)
+    if fuente.get("mtime_ns") == actual["mtime_ns"] and fuente.get("bytes") == actual["bytes"]:
+        return True
+    # El mtime cambia al clonar o copiar: se confirma comparando el contenido
+    return fuente.get("bytes") == actual["bytes"] and fuente.get("sha1") == _sha1_archivo(gif_path)
+
+
+def duraciones_gif(gif_path):
+    """Retorna la duración en milisegundos de cada frame del GIF"""
+    with Image.open(gif_path) as gif:
+        duraciones = []
+        for frame_num in range(gif.n_frames):
+            gif.seek(frame_num)
+            duraciones.append(gif.info.get("duration", 100))
+        return duraciones
+
+
+def guardar_atlas(gif_path, size, frames, duraciones, opaco):
+    """Escribe la hoja RGBA y su índice a partir de una lista de superficies"""
+    ruta_hoja, ruta_indice = rutas_atlas(gif_path, size)
+    ancho, alto = frames[0].get_size()
+    rects = []
+    with open(ruta_hoja, "wb") as hoja:
+        for i, frame in enumerate(frames):
+            hoja.write(pygame.image.tostring(frame, "RGBA"))
+            rects.append({"rect": [0, i * alto, ancho, alto], "duracion": duraciones[i]})
+    indice = {
+        "version": VERSION_ATLAS,
+        "formato": "RGBA",
+        "ancho": ancho,
+        "alto": alto * len(frames),
+        "frames": rects,
+        "opaco": opaco,
+        "fuente": dict(_datos_fuente(gif_path), sha1=_sha1_archivo(gif_path)),
+    }
+    with open(ruta_indice, "w", encoding="utf-8") as archivo:
+        json.dump(indice, archivo)
+    return ruta_hoja
+
+
+def cargar_atlas(gif_path, size=None):
+    """Carga los frames de un atlas vigente mapeándolo en memoria
+
+    Retorna (frames, opaco), o None si no hay atlas o si está desactualizado
+    (entonces se usa el GIF).
+    """
+    ruta_hoja, ruta_indice = rutas_atlas(gif_path, size)
+    if not os.path.exists(ruta_indice) or not os.path.exists(ruta_hoja):
+        return None
+    try:
+        with open(ruta_indice, "r", encoding="utf-8") as archivo:
+            indice = json.load(archivo)
+        if not atlas_vigente(gif_path, indice):
+            print(f"⚠️ Atlas desactualizado, usando GIF: {ruta_hoja}")
+            return None
+        with open(ruta_hoja, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        # La superficie comparte la memoria del mapa (y lo mantiene abierto)
+        hoja = pygame.image.frombuffer(mapa, (indice["ancho"], indice["alto"]), indice["formato"])
+        frames = [hoja.subsurface(pygame.Rect(frame["rect"])) for frame in indice["frames"]]
+        return frames, indice["opaco"]
+    except Exception as e:
+        print(f"Error cargando atlas {ruta_hoja}: {e}")
+        return None
+
+
+def gifs_a_hornear(biomas=False):
+    """Lista de (gif_path, size) según ATLAS_A_HORNEAR (y ATLAS_BIOMAS si se piden)"""
+    trabajos = []
+    for ruta, tamanos in ATLAS_A_HORNEAR + (ATLAS_BIOMAS if biomas else []):
+        if os.path.isdir(ruta):
+            gifs = sorted(os.path.join(ruta, nombre) for nombre in os.listdir(ruta)
+                          if nombre.lower().endswith(".gif"))
+        else:
+            gifs = [ruta] if os.path.exists(ruta) else []
+        for gif_path in gifs:
+            for size in tamanos:
+                trabajos.append((gif_path, size))
+    return trabajos
+
+
+def hornear(trabajos):
+    """Genera los atlas indicados; retorna cuántos se escribieron"""
+    import recursos
+    escritos = 0
+    for gif_path, size in trabajos:
+        frames, opaco = recursos._cargar_frames(gif_path, size, usar_atlas=False)
+        ruta_hoja = guardar_atlas(gif_path, size, frames, duraciones_gif(gif_path), opaco)
+        escritos += 1
+        print(f"🧱 Atlas horneado: {ruta_hoja} ({len(frames)} frames)")
+    return escritos
+
+
+def limpiar(trabajos):
+    """Borra los atlas generados para los trabajos indicados"""
+    for gif_path, size in trabajos:
+        for ruta in rutas_atlas(gif_path, size):
+            if os.path.exists(ruta):
+                os.remove(ruta)
+
+
+def main():
+    if "--limpiar" in sys.argv[1:]:
+        trabajos = gifs_a_hornear(biomas=True)
+        limpiar(trabajos)
+        print(f"🧹 Atlas eliminados ({len(trabajos)} posibles)")
+    else:
+        total = hornear(gifs_a_hornear(biomas="--biomas" in sys.argv[1:]))
+        print(f"✅ {total} atlas horneados")
+
+
+if __name__ == "__main__":
+    main()
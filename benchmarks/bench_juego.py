@@ -0,0 +1,283 @@
+# ================== BENCHMARKS DEL JUEGO ==================
+# Archivo separado con las mediciones de rendimiento sobre los assets reales
+# Corre sin ventana ni audio (drivers "dummy" de SDL), escribe los resultados
+# en JSON y los compara contra una base guardada para detectar regresiones
+#
+# MEDICIONES:
+# - load_gif_frames por clase de asset (apus, illas, biomas, ekeko), con caché vacío
+# - AnimatedBackground para cada entrada de BIOMA_GIFS
+# - GameManager() en frío, restart_game y advance_to_next_scene
+# - Precalentamiento de todos los GIFs de una partida: en serie y en procesos
+# - update() y draw() por frame en MENU, PLAYING (normal, con pregunta y con
+#   mochila) y VICTORY
+#
+# USO: python benchmarks/bench_juego.py                 (mide y compara con la base)
+#      python benchmarks/bench_juego.py --guardar-base  (mide y guarda la base)
+#      python benchmarks/bench_juego.py --rapido        (menos repeticiones)
+#      python benchmarks/bench_juego.py --tolerancia 0.3
+#
+# La base depende de la máquina: se guarda una por equipo de CI en benchmarks/base.json
+
+import os
+import sys
+
+# Los assets usan rutas relativas: se mide siempre desde la raíz del proyecto
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(RAIZ)
+sys.path.insert(0, RAIZ)
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import time
+
+# simulacion activa los drivers sin pantalla antes de importar el juego
+import simulacion
+import jugar
+import atlas
+import decodificacion
+import recursos
+import renderizado
+import textos
+import pygame
+
+RUTA_RESULTADOS = os.path.join("benchmarks", "resultados.json")
+RUTA_BASE = os.path.join("benchmarks", "base.json")
+
+# Una medición es regresión si su mediana empeora más que esto respecto a la base
+TOLERANCIA = 0.20
+# ...y si además empeora más de estos milisegundos (evita falsas alarmas en
+# mediciones de microsegundos, donde el ruido supera la tolerancia)
+MINIMO_MS = 0.05
+
+# Frames de calentamiento y medidos en cada estado del juego
+FRAMES_CALENTAMIENTO = 30
+FRAMES_MEDIDOS = 240
+
+
+def limpiar_caches():
+    """Vacía todos los cachés para que cada medición empiece en frío"""
+    recursos.cache_frames.limpiar()
+    recursos.cache_rotaciones.limpiar()
+    textos.cache_textos.limpiar()
+    renderizado.pool_capas.limpiar()
+
+
+def resumir(tiempos):
+    """Estadísticas en milisegundos de una lista de tiempos en milisegundos"""
+    return {
+        "n": len(tiempos),
+        "mediana_ms": statistics.median(tiempos),
+        "min_ms": min(tiempos),
+        "media_ms": statistics.fmean(tiempos),
+    }
+
+
+def medir(funcion, repeticiones, preparar=None):
+    """Mide `funcion` varias veces; `preparar` corre antes de cada repetición sin medirse"""
+    tiempos = []
+    for _ in range(repeticiones):
+        if preparar:
+            preparar()
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return resumir(tiempos)
+
+
+# ================== CARGA DE ASSETS ==================
+def gifs_por_clase():
+    """(clase, [(gif, tamaño)]) con los mismos tamaños que pide el juego"""
+    apus = sorted({f"apus/{datos['gif']}" for datos in jugar.APUS_DATA.values()})
+    illas = sorted(set(jugar.ILLAS_GIFS.values()))
+    biomas = sorted(set(jugar.BIOMA_GIFS))
+    ekeko = jugar.scaled_size("ekeko.gif", 0.1)
+    return [
+        ("apus", [(gif, (jugar.TAMANO_APU, jugar.TAMANO_APU)) for gif in apus if os.path.exists(gif)]),
+        ("illas", [(gif, (jugar.TAMANO_ILLA, jugar.TAMANO_ILLA)) for gif in illas if os.path.exists(gif)]),
+        ("biomas", [(gif, (jugar.SCREEN_WIDTH, jugar.SCREEN_HEIGHT)) for gif in biomas if os.path.exists(gif)]),
+        ("ekeko", [("ekeko.gif", ekeko)]),
+    ]
+
+
+def bench_carga_gifs(resultados, repeticiones):
+    for clase, peticiones in gifs_por_clase():
+        def cargar_todos():
+            for gif, size in peticiones:
+                recursos.load_gif_frames(gif, size)
+        resultados[f"load_gif_frames/{clase}"] = medir(cargar_todos, repeticiones, limpiar_caches)
+
+
+def bench_fondos(resultados, repeticiones):
+    for escena, gif in enumerate(jugar.BIOMA_GIFS):
+        nombre = f"AnimatedBackground/{escena:02d}-{os.path.basename(gif)}"
+        resultados[nombre] = medir(lambda: jugar.AnimatedBackground(scene_number=escena).cerrar(),
+                                   repeticiones, limpiar_caches)
+
+
+# ================== CICLO DE VIDA DEL JUEGO ==================
+def bench_ciclo_de_vida(resultados, repeticiones):
+    juegos = []
+
+    def construir():
+        juegos.append(jugar.GameManager())
+
+    resultados["GameManager()/frio"] = medir(construir, repeticiones, limpiar_caches)
+    for game in juegos[:-1]:
+        game.cerrar()
+    game = juegos[-1]
+
+    resultados["restart_game"] = medir(game.restart_game, repeticiones)
+
+    # Avance con caché vacío: peor caso, sin la precarga en segundo plano
+    def preparar_partida():
+        game.restart_game()
+        game.game_state = "PLAYING"
+
+    tiempos = []
+    for _ in range(repeticiones):
+        preparar_partida()
+        for _ in range(game.total_scenes - 1):
+            limpiar_caches()
+            inicio = time.perf_counter()
+            game.advance_to_next_scene()
+            game.scenes[game.current_scene]  # La escena nueva se construye al usarla
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+    resultados["advance_to_next_scene/frio"] = resumir(tiempos)
+    return game
+
+
+def bench_precalentar(resultados, game, repeticiones):
+    peticiones = game.recursos_del_juego()
+
+    def en_serie():
+        for gif, size, *opciones in peticiones:
+            recursos.load_gif_frames(gif, size, paleta=bool(opciones and opciones[0]))
+
+    resultados["precalentar/serie"] = medir(en_serie, repeticiones, limpiar_caches)
+    resultados["precalentar/procesos"] = medir(lambda: decodificacion.precalentar(peticiones),
+                                               repeticiones, limpiar_caches)
+
+
+# ================== COSTO POR FRAME ==================
+def preparar_estado(game, estado):
+    """Deja el juego en uno de los estados medidos"""
+    game.leer_teclas = lambda: simulacion.EstadoTeclas()
+    if estado == "MENU":
+        game.game_state = "MENU"
+        return
+    game.restart_game()
+    game.game_state = "PLAYING"
+    escena = game.scenes[game.current_scene]
+    if estado == "PLAYING_pregunta":
+        escena.start_question()
+    elif estado == "PLAYING_mochila":
+        for illa in list(jugar.ILLAS_GIFS)[:8]:
+            game.player.mochila.agregar_illa(illa)
+        game.player.mochila.mostrar_mochila = True
+    elif estado == "VICTORY":
+        game.game_state = "VICTORY"
+
+
+def bench_frames(resultados, game, frames):
+    for estado in ["MENU", "PLAYING", "PLAYING_pregunta", "PLAYING_mochila", "VICTORY"]:
+        preparar_estado(game, estado)
+        for _ in range(FRAMES_CALENTAMIENTO):
+            game.update()
+            game.draw(jugar.screen)
+        tiempos_update = []
+        tiempos_draw = []
+        for _ in range(frames):
+            inicio = time.perf_counter()
+            game.update()
+            medio = time.perf_counter()
+            game.draw(jugar.screen)
+            fin = time.perf_counter()
+            tiempos_update.append((medio - inicio) * 1000)
+            tiempos_draw.append((fin - medio) * 1000)
+        resultados[f"update/{estado}"] = resumir(tiempos_update)
+        resultados[f"draw/{estado}"] = resumir(tiempos_draw)
+
+
+# ================== BASE Y COMPARACIÓN ==================
+def metadatos():
+    return {
+        "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "plataforma": platform.platform(),
+        "atlas_horneados": sum(os.path.exists(atlas.rutas_atlas(gif, size)[1])
+                               for gif, size in atlas.gifs_a_hornear()),
+    }
+
+
+def comparar(resultados, base, tolerancia):
+    """Imprime la comparación con la base y retorna los nombres que empeoraron"""
+    regresiones = []
+    print(f"\n{'medición':45} {'base ms':>10} {'actual ms':>10} {'cambio':>8}")
+    for nombre, datos in resultados.items():
+        anterior = base.get(nombre)
+        if not anterior or not anterior["mediana_ms"]:
+            print(f"{nombre:45} {'-':>10} {datos['mediana_ms']:10.3f} {'nuevo':>8}")
+            continue
+        cambio = datos["mediana_ms"] / anterior["mediana_ms"] - 1
+        empeoro = cambio > tolerancia and datos["mediana_ms"] - anterior["mediana_ms"] > MINIMO_MS
+        marca = "  ❌" if empeoro else ""
+        print(f"{nombre:45} {anterior['mediana_ms']:10.3f} {datos['mediana_ms']:10.3f} {cambio:+8.1%}{marca}")
+        if empeoro:
+            regresiones.append(nombre)
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de La Travesía de Ekeko")
+    parser.add_argument("--guardar-base", action="store_true", help="guardar los resultados como base")
+    parser.add_argument("--rapido", action="store_true", help="menos repeticiones (resultados más ruidosos)")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="empeoramiento de la mediana aceptado (0.2 = 20%%)")
+    parser.add_argument("--salida", default=RUTA_RESULTADOS, help="archivo JSON de resultados")
+    parser.add_argument("--base", default=RUTA_BASE, help="archivo JSON de la base")
+    args = parser.parse_args()
+
+    repeticiones = 2 if args.rapido else 5
+    frames = FRAMES_MEDIDOS // 4 if args.rapido else FRAMES_MEDIDOS
+    resultados = {}
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        bench_carga_gifs(resultados, repeticiones)
+        bench_fondos(resultados, repeticiones)
+        game = bench_ciclo_de_vida(resultados, repeticiones)
+        bench_precalentar(resultados, game, repeticiones)
+        bench_frames(resultados, game, frames)
+        game.cerrar()
+    print(f"⏱️ {len(resultados)} mediciones en {time.perf_counter() - inicio:.1f} s")
+
+    informe = {"meta": metadatos(), "resultados": resultados}
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(informe, archivo, indent=2, ensure_ascii=False)
+    print(f"📄 Resultados: {args.salida}")
+
+    if args.guardar_base:
+        with open(args.base, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+        print(f"📌 Base guardada: {args.base}")
+        return 0
+
+    if not os.path.exists(args.base):
+        print(f"⚠️ No hay base en {args.base}: usa --guardar-base para crearla")
+        return 0
+    with open(args.base, "r", encoding="utf-8") as archivo:
+        base = json.load(archivo)
+    regresiones = comparar(resultados, base["resultados"], args.tolerancia)
+    if regresiones:
+        print(f"\n❌ {len(regresiones)} regresiones (más de {args.tolerancia:.0%} más lento)")
+        return 1
+    print("\n✅ Sin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# ================== BYTES AHORRADOS AL ESCALAR EN PIL ==================
+# Archivo separado con el informe por asset del escalado dentro del decodificador
+# Antes cada frame se copiaba a pygame en su tamaño original (tobytes +
+# fromstring) y recién ahí se escalaba; ahora las reducciones se hacen en PIL y
+# a pygame solo llegan los píxeles del tamaño final (las ampliaciones, como los
+# fondos de bioma, se siguen escalando en pygame y no cambian)
+#
+# Recorre los mismos GIFs y tamaños que carga una partida completa
+# (GameManager.recursos_del_juego, más los fondos de bioma aunque vayan en
+# streaming), decodifica cada uno de las dos formas (recursos.ESCALAR_EN_PIL) y
+# lee de recursos.bytes_copiados los bytes que pasaron por tobytes/fromstring y
+# los de las superficies que escaló pygame
+#
+# USO: python benchmarks/bytes_escalado.py
+#      python benchmarks/bytes_escalado.py --salida bytes.json
+
+import os
+import sys
+
+# Los assets usan rutas relativas: se mide siempre desde la raíz del proyecto
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(RAIZ)
+sys.path.insert(0, RAIZ)
+
+import argparse
+import contextlib
+import io
+import json
+
+# simulacion activa los drivers sin pantalla antes de importar el juego
+import simulacion
+import jugar
+import recursos
+
+MB = 1024 * 1024
+
+
+def decodificar(gif_path, size, paleta, escalar_en_pil):
+    """Decodifica un GIF sin caché ni atlas; retorna (frames, bytes copiados)"""
+    recursos.ESCALAR_EN_PIL = escalar_en_pil
+    recursos.reiniciar_bytes_copiados()
+    try:
+        frames = recursos._cargar_frames_paleta(gif_path, size) if paleta else None
+        if not frames:
+            recursos.reiniciar_bytes_copiados()  # Tenía transparencia: va en RGBA
+            frames, _ = recursos._cargar_frames(gif_path, size, usar_atlas=False)
+        return frames, dict(recursos.bytes_copiados)
+    finally:
+        recursos.ESCALAR_EN_PIL = True
+
+
+def medir_asset(gif_path, size, paleta):
+    """Bytes copiados al decodificar todos los frames, antes y ahora"""
+    _, antes = decodificar(gif_path, size, paleta, escalar_en_pil=False)
+    frames, ahora = decodificar(gif_path, size, paleta, escalar_en_pil=True)
+    return {
+        "gif": gif_path,
+        "original": list(recursos.gif_size(gif_path)),
+        "tamano": list(size or recursos.gif_size(gif_path)),
+        "paleta": bool(frames) and frames[0].get_bitsize() == 8,
+        "frames": len(frames),
+        "bytes_antes": sum(antes.values()),
+        "bytes_ahora": sum(ahora.values()),
+        "detalle_antes": antes,
+        "detalle_ahora": ahora,
+    }
+
+
+def informe():
+    """Una fila por (GIF, tamaño) de una partida completa"""
+    game = simulacion.crear_juego()
+    peticiones = game.recursos_del_juego()
+    peticiones += [(gif, (jugar.SCREEN_WIDTH, jugar.SCREEN_HEIGHT), jugar.FONDOS_EN_PALETA)
+                   for gif in jugar.BIOMA_GIFS]
+    filas = []
+    for gif_path, size, *opciones in dict.fromkeys(peticiones):
+        if os.path.exists(gif_path):
+            filas.append(medir_asset(gif_path, size, bool(opciones and opciones[0])))
+    game.cerrar()
+    return filas
+
+
+def imprimir(filas):
+    print(f"{'gif':34} {'original':>9} {'final':>9} {'frames':>6} {'antes MB':>9} "
+          f"{'ahora MB':>9} {'ahorro MB':>10}")
+    for fila in sorted(filas, key=lambda f: f["bytes_ahora"] - f["bytes_antes"]):
+        original = "x".join(map(str, fila["original"]))
+        final = "x".join(map(str, fila["tamano"])) + (" P" if fila["paleta"] else "")
+        ahorro = fila["bytes_antes"] - fila["bytes_ahora"]
+        print(f"{fila['gif']:34} {original:>9} {final:>9} {fila['frames']:>6} "
+              f"{fila['bytes_antes'] / MB:9.2f} {fila['bytes_ahora'] / MB:9.2f} {ahorro / MB:10.2f}")
+    antes = sum(fila["bytes_antes"] for fila in filas)
+    ahora = sum(fila["bytes_ahora"] for fila in filas)
+    print(f"\n📉 {len(filas)} assets: {antes / MB:.1f} MB antes, {ahora / MB:.1f} MB ahora "
+          f"({(antes - ahora) / MB:.1f} MB menos copiados al decodificar)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes ahorrados al escalar los GIFs en PIL")
+    parser.add_argument("--salida", help="guardar también las filas en un JSON")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        filas = informe()
+    imprimir(filas)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(filas, archivo, indent=2, ensure_ascii=False)
+        print(f"📄 Informe: {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
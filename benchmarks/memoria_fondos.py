@@ -0,0 +1,93 @@
+# ================== MEMORIA DE LOS FONDOS DE BIOMA ==================
+# Archivo separado con el informe de memoria de cada entrada de BIOMA_GIFS
+# Decodifica cada bioma a pantalla completa de las dos formas y compara los
+# bytes de píxeles: RGBA (formato de la pantalla) contra 8 bits con paleta
+# También muestra lo que queda en memoria con los fondos en streaming
+#
+# USO: python benchmarks/memoria_fondos.py
+#      python benchmarks/memoria_fondos.py --salida memoria.json
+
+import os
+import sys
+
+# Los assets usan rutas relativas: se mide siempre desde la raíz del proyecto
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(RAIZ)
+sys.path.insert(0, RAIZ)
+
+import argparse
+import contextlib
+import io
+import json
+
+# simulacion activa los drivers sin pantalla antes de importar el juego
+import simulacion
+import jugar
+import recursos
+
+MB = 1024 * 1024
+
+
+def medir_gif(gif_path, size):
+    """Bytes de píxeles de un GIF decodificado en RGBA y con paleta"""
+    frames, opaco = recursos._cargar_frames(gif_path, size, usar_atlas=False)
+    rgba = recursos.bytes_de_frames(recursos.a_formato_pantalla(frames, opaco))
+    frames_paleta = recursos._cargar_frames_paleta(gif_path, size)
+    paleta = recursos.bytes_de_frames(frames_paleta) if frames_paleta else None
+    return {"frames": len(frames), "bytes_rgba": rgba, "bytes_paleta": paleta}
+
+
+def informe():
+    """Una fila por entrada de BIOMA_GIFS (los GIFs repetidos se miden una vez)"""
+    size = (jugar.SCREEN_WIDTH, jugar.SCREEN_HEIGHT)
+    medidos = {}
+    filas = []
+    for escena, gif in enumerate(jugar.BIOMA_GIFS):
+        fila = {"escena": escena + 1, "gif": gif}
+        if os.path.exists(gif):
+            if gif not in medidos:
+                medidos[gif] = medir_gif(gif, size)
+            fila.update(medidos[gif])
+        filas.append(fila)
+    return filas
+
+
+def imprimir(filas):
+    frames_anillo = jugar.FRAMES_FONDO_EN_MEMORIA + 2  # Cola + frame mostrado + en decodificación
+    print(f"{'escena':>6}  {'gif':28} {'frames':>6} {'RGBA MB':>9} {'paleta MB':>10} "
+          f"{'ahorro':>7} {'streaming MB':>13}")
+    for fila in filas:
+        if "frames" not in fila:
+            print(f"{fila['escena']:>6}  {fila['gif']:28} {'fondo estático':>35}")
+            continue
+        rgba = fila["bytes_rgba"]
+        paleta = fila["bytes_paleta"]
+        por_frame = (paleta if paleta and jugar.FONDOS_EN_PALETA else rgba) / fila["frames"]
+        streaming = min(fila["frames"], frames_anillo) * por_frame
+        texto_paleta = f"{paleta / MB:10.1f} {1 - paleta / rgba:7.0%}" if paleta else f"{'-':>10} {'-':>7}"
+        print(f"{fila['escena']:>6}  {fila['gif']:28} {fila['frames']:>6} {rgba / MB:9.1f} "
+              f"{texto_paleta} {streaming / MB:13.1f}")
+
+    unicos = {fila["gif"]: fila for fila in filas if "frames" in fila}.values()
+    total_rgba = sum(fila["bytes_rgba"] for fila in unicos)
+    total_paleta = sum(fila["bytes_paleta"] or fila["bytes_rgba"] for fila in unicos)
+    print(f"\n📦 {len(unicos)} GIFs distintos: {total_rgba / MB:.1f} MB en RGBA, "
+          f"{total_paleta / MB:.1f} MB con paleta")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria de los fondos de bioma: RGBA contra paleta")
+    parser.add_argument("--salida", help="guardar también las filas en un JSON")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        filas = informe()
+    imprimir(filas)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(filas, archivo, indent=2, ensure_ascii=False)
+        print(f"📄 Informe: {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# ================== DECODIFICACIÓN EN VARIOS PROCESOS ==================
+# Archivo separado con la carga en paralelo de muchos GIFs a la vez
+# Decodificar es trabajo de CPU en PIL: con hilos se comparte un solo núcleo,
+# así que el precalentamiento completo reparte los GIFs entre procesos
+#
+# FUNCIONAMIENTO:
+# - Cada proceso decodifica y escala un GIF (RGBA, o 8 bits con paleta) y copia
+#   los píxeles de todos sus frames en un bloque de multiprocessing.shared_memory
+# - Por la cola del executor solo viaja el nombre del bloque y los tamaños
+# - El proceso principal envuelve el bloque con pygame.image.frombuffer (sin
+#   copiarlo), convierte cada frame al formato de la pantalla, guarda el
+#   resultado en el caché y libera el bloque (close + unlink)
+#
+# USO: python jugar.py --precalentar
+#      decodificacion.precalentar(game.recursos_del_juego())
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context, shared_memory
+
+import pygame
+
+import recursos
+import traza
+
+
+# ================== EN EL PROCESO TRABAJADOR ==================
+def _decodificar_a_memoria_compartida(gif_path, size, paleta):
+    """Decodifica un GIF y deja sus frames en un bloque de memoria compartida
+
+    Retorna (nombre del bloque, tamaños, formato, opaco, colores de la paleta)
+    o None si el GIF no tiene frames. El bloque lo libera el proceso principal.
+    """
+    frames = recursos._cargar_frames_paleta(gif_path, size) if paleta else None
+    if frames:
+        formato, opaco, colores = "P", True, frames[0].get_palette()
+    else:
+        frames, opaco = recursos._cargar_frames(gif_path, size)
+        formato, colores = "RGBA", None
+    if not frames:
+        return None
+
+    datos = [pygame.image.tobytes(frame, formato) for frame in frames]
+    bloque = shared_memory.SharedMemory(create=True, size=sum(len(d) for d in datos))
+    inicio = 0
+    for d in datos:
+        bloque.buf[inicio:inicio + len(d)] = d
+        inicio += len(d)
+    nombre = bloque.name
+    bloque.close()
+    return nombre, [frame.get_size() for frame in frames], formato, opaco, colores
+
+
+# ================== EN EL PROCESO PRINCIPAL ==================
+def _frames_desde_memoria_compartida(nombre, tamanos, formato, opaco, colores):
+    """Convierte los frames de un bloque en superficies propias y libera el bloque"""
+    bloque = shared_memory.SharedMemory(name=nombre)
+    vistas = []
+    try:
+        originales = []
+        inicio = 0
+        bytes_por_pixel = 1 if formato == "P" else 4
+        for ancho, alto in tamanos:
+            vista = bloque.buf[inicio:inicio + ancho * alto * bytes_por_pixel]
+            vistas.append(vista)
+            frame = pygame.image.frombuffer(vista, (ancho, alto), formato)
+            if colores:
+                frame.set_palette(colores)
+            originales.append(frame)
+            inicio += ancho * alto * bytes_por_pixel
+
+        if formato == "P":
+            frames = [frame.copy() for frame in originales]  # Se quedan en 8 bits
+        else:
+            frames = recursos.a_formato_pantalla(originales, opaco)
+            # Un frame que no necesitó conversión sigue apuntando al bloque: se copia
+            frames = [frame.copy() if frame is original else frame
+                      for frame, original in zip(frames, originales)]
+        del originales, frame
+        return frames
+    finally:
+        for vista in vistas:
+            vista.release()
+        bloque.close()
+        bloque.unlink()
+
+
+class _SinScriptPrincipal:
+    """Oculta el módulo principal mientras se crean los procesos
+
+    Con "spawn" cada proceso nuevo vuelve a ejecutar el módulo principal: por su
+    __spec__ si se lanzó con "python -m jugar", o por su __file__ si se lanzó con
+    "python jugar.py". jugar abre la pantalla al importarse, y los trabajadores
+    solo necesitan este módulo, así que se ocultan los dos.
+    """
+    def __enter__(self):
+        self.principal = sys.modules["__main__"]
+        self.archivo = self.principal.__dict__.pop("__file__", None)
+        self.spec = getattr(self.principal, "__spec__", None)
+        self.principal.__spec__ = None
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        return self
+
+    def __exit__(self, *exc):
+        if self.archivo is not None:
+            self.principal.__file__ = self.archivo
+        self.principal.__spec__ = self.spec
+        return False
+
+
+def precalentar(peticiones, procesos=None):
+    """Carga en el caché, en paralelo, los GIFs pedidos que todavía no estén
+
+    - peticiones: lista de (gif_path, size) o (gif_path, size, paleta)
+    - procesos: cantidad de procesos (None = un proceso por núcleo)
+    Retorna cuántos GIFs se cargaron. Si un proceso falla, ese GIF se carga
+    después con load_gif_frames como siempre.
+    """
+    pendientes = {}
+    for gif_path, size, *opciones in peticiones:
+        paleta = bool(opciones and opciones[0])
+        clave = recursos.clave_cache(gif_path, size, paleta=paleta)
+        if clave not in recursos.cache_frames and os.path.exists(gif_path):
+            pendientes[clave] = (gif_path, size, paleta)
+    if not pendientes:
+        return 0
+
+    procesos = min(procesos or os.cpu_count() or 1, len(pendientes))
+    inicio = time.perf_counter()
+    cargados = 0
+    with traza.tramo("precalentar", "carga", gifs=len(pendientes), procesos=procesos):
+        with ProcessPoolExecutor(max_workers=procesos, mp_context=get_context("spawn")) as executor:
+            with _SinScriptPrincipal():
+                futuros = {executor.submit(_decodificar_a_memoria_compartida, *datos): clave
+                           for clave, datos in pendientes.items()}
+            for futuro in as_completed(futuros):
+                clave = futuros[futuro]
+                gif_path = pendientes[clave][0]
+                try:
+                    resultado = futuro.result()
+                except Exception as e:
+                    print(f"Error decodificando {gif_path} en otro proceso: {e}")
+                    continue
+                if resultado is None:
+                    continue
+                if resultado[2] != "P":
+                    clave = recursos.clave_cache(gif_path, pendientes[clave][1])  # Sin paleta: RGBA
+                recursos.cache_frames.guardar(clave, _frames_desde_memoria_compartida(*resultado))
+                cargados += 1
+    print(f"🔥 Precalentados {cargados} GIFs con {procesos} procesos "
+          f"en {time.perf_counter() - inicio:.2f} s")
+    return cargados
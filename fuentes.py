@@ -0,0 +1,71 @@
+# ================== REGISTRO DE FUENTES ==================
+# Archivo separado con todas las fuentes del juego
+# Las fuentes se crean una sola vez con cargar() después de pygame.init()
+# y luego solo se consultan por nombre: no se pueden crear fuentes en un draw
+
+import pygame
+
+# Fuentes del juego: nombre -> (familia, tamaño, negrita, cursiva)
+FUENTES = {
+    # Sprites y HUD (jugar.py)
+    "etiqueta": ("Arial", 18, True, False),           # Ekeko y Apu
+    "portal": ("Arial", 16, True, False),
+    "portal_pista": ("Arial", 12, False, False),
+    "illa": ("Arial", 14, True, False),
+    "mochila": ("Arial", 14, True, False),
+    "mochila_pequena": ("Arial", 12, False, False),
+    "pregunta_titulo": ("Arial", 24, True, False),
+    "pregunta": ("Arial", 18, False, False),
+    "pregunta_opciones": ("Arial", 16, False, False),
+    "hud": ("Arial", 20, True, False),
+    "hud_mensaje": ("Arial", 18, True, False),
+    "hud_pista": ("Arial", 12, True, False),
+    "grande": ("Arial", 36, True, False),
+    "mediana": ("Arial", 24, True, False),
+    "creditos_titulo": ("Arial", 24, True, False),
+    "creditos": ("Arial", 18, False, False),
+    "creditos_pequena": ("Arial", 16, False, False),
+    # Menú (menu.py)
+    "menu_titulo": ("Arial", 48, True, False),
+    "menu_subtitulo": ("Arial", 24, True, False),
+    "menu_opciones": ("Arial", 32, True, False),
+    "menu_ekeko": ("Arial", 16, True, False),
+    "menu_nav": ("Arial", 18, False, False),
+    "menu_info": ("Arial", 14, False, False),
+    "instrucciones_titulo": ("Arial", 36, True, False),
+    "instrucciones_texto": ("Arial", 18, False, False),
+    # Libro de instrucciones (instrucciones.py)
+    "libro_titulo": ("Arial", 20, True, False),
+    "libro_seccion": ("Arial", 16, True, False),
+    "libro_texto": ("Arial", 13, False, False),
+    "libro_control": ("Arial", 12, False, False),
+    "libro_pagina": ("Arial", 10, False, True),
+    "libro_nav": ("Arial", 12, False, True),
+    # Panel del perfilador (perfilador.py)
+    "perfil": ("Courier New", 12, False, False),
+}
+
+_fuentes = {}  # nombre -> pygame.font.Font
+
+
+def cargar():
+    """Crea todas las fuentes del registro (una sola vez, después de pygame.init())
+
+    Los nombres con la misma familia, tamaño y estilo comparten el mismo objeto.
+    """
+    if _fuentes:
+        return
+    por_estilo = {}
+    for nombre, estilo in FUENTES.items():
+        if estilo not in por_estilo:
+            familia, tamano, negrita, cursiva = estilo
+            por_estilo[estilo] = pygame.font.SysFont(familia, tamano, bold=negrita, italic=cursiva)
+        _fuentes[nombre] = por_estilo[estilo]
+    print(f"🔤 {len(por_estilo)} fuentes cargadas para {len(_fuentes)} usos")
+
+
+def fuente(nombre):
+    """Retorna una fuente ya cargada del registro (nunca crea una nueva)"""
+    if not _fuentes:
+        raise RuntimeError("Fuentes no cargadas: llama a fuentes.cargar() después de pygame.init()")
+    return _fuentes[nombre]
@@ -0,0 +1,260 @@
+# ================== GRABACIÓN Y REPETICIÓN DE PARTIDAS ==================
+# Archivo separado con el grabador de entrada y el reproductor de partidas
+# Una partida se reproduce frame a frame: mismas teclas y mismos eventos en el
+# mismo tick, y los mismos pasos de simulación entre dibujo y dibujo, dan
+# exactamente la misma carga de trabajo en cada frame
+#
+# FORMATO DEL REGISTRO (binario, little-endian):
+# - Cabecera: b"EKRG", versión (u8), cantidad de teclas (u8) y sus códigos (i32)
+# - Resto comprimido con zlib:
+#   - cantidad de ticks (u32), de eventos (u32) y de frames (u32)
+#   - una máscara de teclas presionadas por tick (u16)
+#   - eventos: tick (u32), tipo (u8), tecla (i32), modificadores (u16)
+#   - frames: pasos de simulación (u16), eventos atendidos antes (u16) y alpha
+#     de interpolación (f32)
+# - La versión 1 no tiene frames: se repite tick a tick, con un dibujo por tick
+#
+# USO: python jugar.py --grabar partida.ekr        (graba una partida real)
+#      python simulacion.py --grabar partida.ekr   (graba la partida del piloto)
+#      python grabacion.py partida.ekr              (la repite sin pantalla)
+#      python -m cProfile -s cumtime grabacion.py partida.ekr
+
+import array
+import contextlib
+import io
+import itertools
+import struct
+import sys
+import time
+import zlib
+
+import pygame
+
+MAGIA = b"EKRG"
+VERSION_GRABACION = 2
+
+# Teclas cuyo estado se graba en cada tick (bit i = TECLAS_GRABADAS[i])
+TECLAS_GRABADAS = (
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_j,
+    pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+    pygame.K_RETURN, pygame.K_SPACE, pygame.K_ESCAPE, pygame.K_m,
+)
+
+# Tipos de evento que se graban (los que consume GameManager.handle_event)
+TIPOS_EVENTO = {pygame.KEYDOWN: 0, pygame.KEYUP: 1}
+EVENTO = struct.Struct("<IBiH")
+FRAME = struct.Struct("<HHf")
+
+
+class GrabadorEntrada:
+    """Graba las teclas y los eventos que recibe un GameManager, tick a tick
+
+    conectar(game) envuelve game.leer_teclas, game.handle_event, game.simular y
+    game.render: el juego sigue recibiendo la entrada real y, a la vez, queda
+    anotada con el tick de game.tick, junto con los pasos y el alpha de cada frame.
+    """
+    def __init__(self, teclas=TECLAS_GRABADAS):
+        self.teclas = tuple(teclas)
+        self.mascaras = {}  # tick -> máscara de teclas presionadas
+        self.eventos = []   # (tick, tipo, tecla, modificadores)
+        self.frames = []    # (pasos, eventos, alpha) de cada render
+        self.pasos_del_frame = 0
+        self.eventos_del_frame = 0
+        self.game = None
+
+    def conectar(self, game):
+        """Empieza a grabar la entrada de `game`"""
+        self.game = game
+        leer_teclas = game.leer_teclas
+        handle_event = game.handle_event
+        simular = game.simular
+        render = game.render
+
+        def leer_teclas_grabando():
+            estado = leer_teclas()
+            mascara = 0
+            for i, tecla in enumerate(self.teclas):
+                if estado[tecla]:
+                    mascara |= 1 << i
+            self.mascaras[game.tick] = mascara
+            return estado
+
+        def handle_event_grabando(event):
+            tipo = TIPOS_EVENTO.get(event.type)
+            if tipo is not None:
+                self.eventos.append((game.tick, tipo, event.key, getattr(event, "mod", 0)))
+                self.eventos_del_frame += 1
+            return handle_event(event)
+
+        def simular_grabando(ticks):
+            self.pasos_del_frame += ticks
+            return simular(ticks)
+
+        def render_grabando(screen):
+            self.frames.append((self.pasos_del_frame, self.eventos_del_frame,
+                                game.alpha_interpolacion))
+            self.pasos_del_frame = 0
+            self.eventos_del_frame = 0
+            return render(screen)
+
+        game.leer_teclas = leer_teclas_grabando
+        game.handle_event = handle_event_grabando
+        game.simular = simular_grabando
+        game.render = render_grabando
+
+    def guardar(self, ruta):
+        """Escribe el registro binario; retorna su tamaño en bytes"""
+        total_ticks = self.game.tick if self.game else 0
+        mascaras = array.array("H", (self.mascaras.get(tick, 0) for tick in range(total_ticks)))
+        if sys.byteorder != "little":
+            mascaras.byteswap()
+        cuerpo = [struct.pack("<III", total_ticks, len(self.eventos), len(self.frames)),
+                  mascaras.tobytes()]
+        cuerpo.extend(EVENTO.pack(*evento) for evento in self.eventos)
+        cuerpo.extend(FRAME.pack(*frame) for frame in self.frames)
+        cabecera = MAGIA + struct.pack("<BB", VERSION_GRABACION, len(self.teclas))
+        cabecera += struct.pack(f"<{len(self.teclas)}i", *self.teclas)
+        datos = cabecera + zlib.compress(b"".join(cuerpo), 9)
+        with open(ruta, "wb") as archivo:
+            archivo.write(datos)
+        print(f"💾 Partida grabada: {ruta} ({total_ticks} ticks, {len(self.frames)} frames, "
+              f"{len(self.eventos)} eventos, {len(datos)} bytes)")
+        return len(datos)
+
+
+class ReproductorEntrada:
+    """Repite un registro grabado con la misma interfaz que simulacion.PilotoAutomatico
+
+    entrada(game) se llama una vez por tick y retorna (teclas presionadas, eventos).
+    Si el registro trae frames (versión 2), repetir_por_frames los usa en su lugar.
+    """
+    def __init__(self, ruta):
+        with open(ruta, "rb") as archivo:
+            datos = archivo.read()
+        if datos[:4] != MAGIA:
+            raise ValueError(f"{ruta} no es una grabación de partida")
+        version, cantidad_teclas = struct.unpack_from("<BB", datos, 4)
+        if version not in (1, VERSION_GRABACION):
+            raise ValueError(f"Versión de grabación no soportada: {version}")
+        self.teclas = struct.unpack_from(f"<{cantidad_teclas}i", datos, 6)
+        cuerpo = zlib.decompress(datos[6 + 4 * cantidad_teclas:])
+
+        if version == 1:
+            self.total_ticks, total_eventos = struct.unpack_from("<II", cuerpo, 0)
+            total_frames = 0
+            inicio = 8
+        else:
+            self.total_ticks, total_eventos, total_frames = struct.unpack_from("<III", cuerpo, 0)
+            inicio = 12
+        self.mascaras = array.array("H")
+        self.mascaras.frombytes(cuerpo[inicio:inicio + 2 * self.total_ticks])
+        if sys.byteorder != "little":
+            self.mascaras.byteswap()
+        inicio += 2 * self.total_ticks
+
+        self.eventos = []  # En el orden en que se atendieron
+        self.eventos_por_tick = {}
+        for tick, tipo, tecla, mod in EVENTO.iter_unpack(cuerpo[inicio:inicio + EVENTO.size * total_eventos]):
+            tipo_pygame = pygame.KEYDOWN if tipo == 0 else pygame.KEYUP
+            evento = pygame.event.Event(tipo_pygame, key=tecla, mod=mod, unicode="", scancode=0)
+            self.eventos.append(evento)
+            self.eventos_por_tick.setdefault(tick, []).append(evento)
+        inicio += EVENTO.size * total_eventos
+
+        self.frames = list(FRAME.iter_unpack(cuerpo[inicio:inicio + FRAME.size * total_frames]))
+        self.tick = 0
+
+    def terminado(self):
+        """True cuando ya se repitieron todos los ticks grabados"""
+        return self.tick >= self.total_ticks
+
+    def entrada(self, game):
+        """Teclas y eventos grabados para el siguiente tick"""
+        if self.terminado():
+            return set(), []
+        mascara = self.mascaras[self.tick]
+        presionadas = {tecla for i, tecla in enumerate(self.teclas) if mascara & (1 << i)}
+        eventos = self.eventos_por_tick.get(self.tick, [])
+        self.tick += 1
+        return presionadas, eventos
+
+    def teclas_del_tick(self, tick):
+        """Teclas presionadas grabadas en un tick dado"""
+        if tick >= self.total_ticks:
+            return set()
+        mascara = self.mascaras[tick]
+        return {tecla for i, tecla in enumerate(self.teclas) if mascara & (1 << i)}
+
+
+def repetir_por_frames(game, reproductor, dibujar=True):
+    """Repite los frames grabados: eventos, simular(pasos) y render, como GameManager.run
+
+    Cada frame avanza los mismos pasos de simulación y se dibuja con el mismo
+    alpha que en la partida original. Retorna el mismo diccionario que
+    simulacion.ejecutar, con la cantidad de frames.
+    """
+    import simulacion
+    import jugar
+    import traza
+
+    teclas = simulacion.EstadoTeclas()
+
+    def leer_teclas():
+        teclas.presionadas = reproductor.teclas_del_tick(game.tick)
+        return teclas
+
+    game.leer_teclas = leer_teclas
+    eventos = iter(reproductor.eventos)
+    salida = contextlib.redirect_stdout(io.StringIO())
+    inicio = time.perf_counter()
+    with salida:
+        for pasos, cantidad_eventos, alpha in reproductor.frames:
+            for evento in itertools.islice(eventos, cantidad_eventos):
+                game.handle_event(evento)
+            with traza.tramo("update", "frame", pasos=pasos):
+                game.simular(pasos)
+            game.alpha_interpolacion = alpha
+            if dibujar:
+                with traza.tramo("draw", "frame", estado=game.game_state):
+                    game.render(jugar.screen)
+    segundos = time.perf_counter() - inicio
+    return {
+        "estado": game.game_state,
+        "escena": game.current_scene + 1,
+        "illas": len(game.player.articulos_collected),
+        "ticks": game.tick,
+        "frames": len(reproductor.frames),
+        "segundos": segundos,
+        "ticks_por_segundo": game.tick / segundos if segundos else 0.0,
+    }
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python grabacion.py partida.ekr [--solo-logica]")
+        return
+    # simulacion activa los drivers sin pantalla antes de importar el juego
+    import simulacion
+
+    reproductor = ReproductorEntrada(sys.argv[1])
+    game = simulacion.crear_juego()
+    dibujar = "--solo-logica" not in sys.argv[2:]
+    if reproductor.frames:
+        resultado = repetir_por_frames(game, reproductor, dibujar)
+    else:
+        # Grabación sin frames (versión 1 o sin dibujo): un dibujo por tick
+        resultado = simulacion.ejecutar(game, reproductor, reproductor.total_ticks,
+                                        dibujar=dibujar, parar_al_terminar=False)
+    game.cerrar()
+    pygame.quit()
+
+    print(f"▶️ Partida repetida: {resultado['estado']} en la escena {resultado['escena']}/14, "
+          f"{resultado['illas']}/19 illas")
+    print(f"⏱️ {resultado['ticks']} ticks en {resultado['segundos']:.2f} s "
+          f"-> {resultado['ticks_por_segundo']:.0f} ticks/s")
+    if "frames" in resultado:
+        print(f"🎞️ {resultado['frames']} frames repetidos con sus pasos de simulación")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@
 # Archivo separado con todas las instrucciones del juego
 # Para mantener el código principal más limpio y organizado
 
+import math
+
 import pygame
 
+from fuentes import fuente
+
 # Colores para las instrucciones (estilo libro de brujas)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -67,9 +71,9 @@ def obtener_instrucciones_pagina2():
 def dibujar_pagina_libro(screen, book_surface, book_width, book_height, instructions, page_num, total_pages):
     """Dibuja una página del libro con las instrucciones"""
     
-    section_font = pygame.font.SysFont("Arial", 16, bold=True)
-    text_font = pygame.font.SysFont("Arial", 13)
-    control_font = pygame.font.SysFont("Arial", 12)
+    section_font = fuente("libro_seccion")
+    text_font = fuente("libro_texto")
+    control_font = fuente("libro_control")
     
     y_offset = 70
     line_height = 18
@@ -101,92 +105,126 @@ def dibujar_pagina_libro(screen, book_surface, book_width, book_height, instruct
             y_offset += line_height
     
     # Número de página
-    page_font = pygame.font.SysFont("Arial", 10, italic=True)
+    page_font = fuente("libro_pagina")
     page_text = page_font.render(f"Página {page_num} de {total_pages}", True, BROWN)
     page_rect = page_text.get_rect(center=(book_width // 2, book_height - 20))
     book_surface.blit(page_text, page_rect)
 
-def dibujar_instrucciones(screen, font_title, font_text, SCREEN_WIDTH, SCREEN_HEIGHT):
-    """Función para dibujar las instrucciones en pantalla con estilo libro de brujas (2 páginas)"""
-    
-    # Variable estática para la página actual
-    if not hasattr(dibujar_instrucciones, 'pagina_actual'):
-        dibujar_instrucciones.pagina_actual = 1
-    
-    # Fondo con textura de pergamino
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(230)
-    overlay.fill(BLACK)
-    screen.blit(overlay, (0, 0))
-    
-    # Crear superficie para el libro (dos páginas)
-    book_width = (SCREEN_WIDTH - 120) // 2  # Ancho de cada página
-    book_height = SCREEN_HEIGHT - 100
-    book_x_left = (SCREEN_WIDTH - (book_width * 2 + 20)) // 2
-    book_y = (SCREEN_HEIGHT - book_height) // 2
-    
-    # Página izquierda (siempre visible)
-    page1_surface = pygame.Surface((book_width, book_height))
-    page1_surface.fill(CREAM)
-    pygame.draw.rect(page1_surface, DARK_BROWN, (0, 0, book_width, book_height), 6)
-    
-    # Título en página izquierda
-    title_font = pygame.font.SysFont("Arial", 20, bold=True)
-    title_text = title_font.render("LIBRO DE LAS", True, DARK_BROWN)
-    title_rect = title_text.get_rect(center=(book_width // 2, 20))
-    page1_surface.blit(title_text, title_rect)
-    subtitle_text = title_font.render("ARTES SAGRADAS", True, DARK_BROWN)
-    subtitle_rect = subtitle_text.get_rect(center=(book_width // 2, 40))
-    page1_surface.blit(subtitle_text, subtitle_rect)
-    
-    # Línea decorativa
-    pygame.draw.line(page1_surface, GOLD, (30, 50), (book_width - 30, 50), 2)
-    
-    # Dibujar contenido de página 1
-    instrucciones_p1 = obtener_instrucciones_pagina1()
-    dibujar_pagina_libro(screen, page1_surface, book_width, book_height, instrucciones_p1, 1, 2)
-    
-    # Página derecha
-    page2_surface = pygame.Surface((book_width, book_height))
-    page2_surface.fill(CREAM)
-    pygame.draw.rect(page2_surface, DARK_BROWN, (0, 0, book_width, book_height), 6)
-    
-    # Línea decorativa superior en página derecha
-    pygame.draw.line(page2_surface, GOLD, (30, 30), (book_width - 30, 30), 2)
-    
-    # Dibujar contenido de página 2
-    instrucciones_p2 = obtener_instrucciones_pagina2()
-    dibujar_pagina_libro(screen, page2_surface, book_width, book_height, instrucciones_p2, 2, 2)
-    
-    # Sombra del libro
-    shadow_surface = pygame.Surface((book_width * 2 + 30, book_height + 10))
-    shadow_surface.set_alpha(100)
-    shadow_surface.fill(BLACK)
-    screen.blit(shadow_surface, (book_x_left - 5, book_y - 5))
-    
-    # Dibujar ambas páginas
-    screen.blit(page1_surface, (book_x_left, book_y))
-    screen.blit(page2_surface, (book_x_left + book_width + 20, book_y))
-    
-    # Línea central (lomo del libro)
-    pygame.draw.line(screen, DARK_BROWN, 
-                    (book_x_left + book_width + 10, book_y),
-                    (book_x_left + book_width + 10, book_y + book_height), 4)
-    
-    # Decoración de estrellas mágicas alrededor
-    import math
-    for i in range(10):
-        angle = (360 / 10) * i
-        dist = 130
-        star_x = SCREEN_WIDTH // 2 + int(dist * math.cos(math.radians(angle)))
-        star_y = SCREEN_HEIGHT // 2 + int(dist * math.sin(math.radians(angle)))
-        star_size = 2
-        pygame.draw.circle(screen, GOLD, (star_x, star_y), star_size)
-        pygame.draw.line(screen, GOLD, (star_x - star_size, star_y), (star_x + star_size, star_y), 1)
-        pygame.draw.line(screen, GOLD, (star_x, star_y - star_size), (star_x, star_y + star_size), 1)
-    
-    # Instrucciones de navegación
-    nav_font = pygame.font.SysFont("Arial", 12, italic=True)
-    nav_text = nav_font.render("Presiona ESC o ENTER para cerrar el libro", True, BROWN)
-    nav_rect = nav_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-    screen.blit(nav_text, nav_rect)
+def crear_pagina_libro(indice, paginas, book_width, book_height):
+    """Crea la superficie de una página del libro (la primera lleva el título)"""
+    page_surface = pygame.Surface((book_width, book_height))
+    page_surface.fill(CREAM)
+    pygame.draw.rect(page_surface, DARK_BROWN, (0, 0, book_width, book_height), 6)
+    
+    if indice >= len(paginas):
+        return page_surface  # Página en blanco al final de un pliego
+    
+    if indice == 0:
+        # Título en la primera página
+        title_font = fuente("libro_titulo")
+        title_text = title_font.render("LIBRO DE LAS", True, DARK_BROWN)
+        title_rect = title_text.get_rect(center=(book_width // 2, 20))
+        page_surface.blit(title_text, title_rect)
+        subtitle_text = title_font.render("ARTES SAGRADAS", True, DARK_BROWN)
+        subtitle_rect = subtitle_text.get_rect(center=(book_width // 2, 40))
+        page_surface.blit(subtitle_text, subtitle_rect)
+        
+        # Línea decorativa
+        pygame.draw.line(page_surface, GOLD, (30, 50), (book_width - 30, 50), 2)
+    else:
+        # Línea decorativa superior en las demás páginas
+        pygame.draw.line(page_surface, GOLD, (30, 30), (book_width - 30, 30), 2)
+    
+    dibujar_pagina_libro(None, page_surface, book_width, book_height, paginas[indice], indice + 1, len(paginas))
+    return page_surface
+
+class LibroInstrucciones:
+    """Libro de instrucciones compuesto una sola vez y guardado en caché
+    
+    FUNCIONAMIENTO DEL CACHÉ:
+    - Cada pliego (dos páginas) se compone una vez en una superficie con alfa
+    - Por frame solo se hace un blit de esa superficie
+    - Las páginas se renderizan la primera vez que se ven
+    - Todo se invalida solo si cambia la resolución
+    """
+    def __init__(self):
+        self.pliego = 0  # Pliego actual (páginas 2*pliego y 2*pliego + 1)
+        self.paginas = [obtener_instrucciones_pagina1(), obtener_instrucciones_pagina2()]
+        self._clave = None
+        self._paginas_renderizadas = {}  # índice -> superficie
+        self._pliegos_compuestos = {}  # pliego -> superficie
+    
+    def total_pliegos(self):
+        return (len(self.paginas) + 1) // 2
+    
+    def pasar_pagina(self, direccion):
+        """Avanza (+1) o retrocede (-1) un pliego; retorna True si cambió"""
+        nuevo = max(0, min(self.total_pliegos() - 1, self.pliego + direccion))
+        cambio = nuevo != self.pliego
+        self.pliego = nuevo
+        return cambio
+    
+    def _pagina(self, indice, book_width, book_height):
+        if indice not in self._paginas_renderizadas:
+            self._paginas_renderizadas[indice] = crear_pagina_libro(indice, self.paginas, book_width, book_height)
+        return self._paginas_renderizadas[indice]
+    
+    def _componer_pliego(self, SCREEN_WIDTH, SCREEN_HEIGHT):
+        """Compone el fondo, la sombra, las dos páginas y la decoración del pliego actual"""
+        composed = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        
+        # Fondo con textura de pergamino
+        composed.fill((0, 0, 0, 230))
+        
+        # Crear superficie para el libro (dos páginas)
+        book_width = (SCREEN_WIDTH - 120) // 2  # Ancho de cada página
+        book_height = SCREEN_HEIGHT - 100
+        book_x_left = (SCREEN_WIDTH - (book_width * 2 + 20)) // 2
+        book_y = (SCREEN_HEIGHT - book_height) // 2
+        
+        # Sombra del libro (con alfa por píxel para mezclarse con el fondo)
+        shadow_surface = pygame.Surface((book_width * 2 + 30, book_height + 10), pygame.SRCALPHA)
+        shadow_surface.fill((0, 0, 0, 100))
+        composed.blit(shadow_surface, (book_x_left - 5, book_y - 5))
+        
+        # Dibujar ambas páginas
+        composed.blit(self._pagina(2 * self.pliego, book_width, book_height), (book_x_left, book_y))
+        composed.blit(self._pagina(2 * self.pliego + 1, book_width, book_height),
+                      (book_x_left + book_width + 20, book_y))
+        
+        # Línea central (lomo del libro)
+        pygame.draw.line(composed, DARK_BROWN, 
+                        (book_x_left + book_width + 10, book_y),
+                        (book_x_left + book_width + 10, book_y + book_height), 4)
+        
+        # Decoración de estrellas mágicas alrededor
+        for i in range(10):
+            angle = (360 / 10) * i
+            dist = 130
+            star_x = SCREEN_WIDTH // 2 + int(dist * math.cos(math.radians(angle)))
+            star_y = SCREEN_HEIGHT // 2 + int(dist * math.sin(math.radians(angle)))
+            star_size = 2
+            pygame.draw.circle(composed, GOLD, (star_x, star_y), star_size)
+            pygame.draw.line(composed, GOLD, (star_x - star_size, star_y), (star_x + star_size, star_y), 1)
+            pygame.draw.line(composed, GOLD, (star_x, star_y - star_size), (star_x, star_y + star_size), 1)
+        
+        # Instrucciones de navegación
+        nav_font = fuente("libro_nav")
+        nav_message = "Presiona ESC o ENTER para cerrar el libro"
+        if self.total_pliegos() > 1:
+            nav_message = "← → para pasar de página - " + nav_message
+        nav_text = nav_font.render(nav_message, True, BROWN)
+        nav_rect = nav_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
+        composed.blit(nav_text, nav_rect)
+        return composed
+    
+    def dibujar(self, screen, SCREEN_WIDTH, SCREEN_HEIGHT):
+        """Dibuja el pliego actual desde el caché (lo compone si hace falta)"""
+        clave = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        if clave != self._clave:
+            self._clave = clave
+            self._paginas_renderizadas.clear()
+            self._pliegos_compuestos.clear()
+        if self.pliego not in self._pliegos_compuestos:
+            self._pliegos_compuestos[self.pliego] = self._componer_pliego(SCREEN_WIDTH, SCREEN_HEIGHT)
+        screen.blit(self._pliegos_compuestos[self.pliego], (0, 0))
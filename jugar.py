@@ -3,7 +3,15 @@ import sys
 import os
 import random
 import math
-from PIL import Image
+import fuentes
+import traza
+from fuentes import fuente
+from planificador import PlanificadorFrames
+from renderizado import RenderizadorRectangulos, capa_translucida
+from textos import render_text, render_text_shadow
+from recursos import (load_gif_frames, scaled_size, rotated_frame, PrecargadorRecursos,
+                      GifEnStreaming, descartar_gif, convertir_pendientes,
+                      verificar_formato_pantalla)
 
 # ================== PYGAME INICIO ==================
 pygame.init()
@@ -15,6 +23,9 @@ SCREEN_HEIGHT = 600
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("La Travesía de Ekeko - 14 Escenas")
 
+# Fuentes: se crean una sola vez para todo el juego
+fuentes.cargar()
+
 # Colores
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -27,8 +38,26 @@ DARK_GRAY = (64, 64, 64)
 
 # FPS
 FPS = 60
+# FPS por estado: None = esperar eventos (pantallas estáticas, casi no gastan CPU)
+FPS_POR_ESTADO = {
+    "PLAYING": 60,
+    "MENU": 30,
+    "INSTRUCTIONS": None,
+    "GAME_OVER": None,
+    "VICTORY": None,
+}
 clock = pygame.time.Clock()
 
+# Fondos de bioma en streaming: solo FRAMES_FONDO_EN_MEMORIA frames decodificados
+# por bioma en lugar del GIF completo (False = todos los frames en el caché)
+FONDOS_EN_STREAMING = True
+FRAMES_FONDO_EN_MEMORIA = 6
+# Fondos de bioma en 8 bits con la paleta del GIF: la cuarta parte de memoria que RGBA
+FONDOS_EN_PALETA = True
+# Al volver a un bioma ya visto su fondo sigue la animación donde quedó
+# (False = vuelve a empezar desde el primer frame)
+CONTINUAR_ANIMACION_FONDO = True
+
 # ================== ÁRBOL BINARIO PARA APUS ==================
 class NodoApu:
     """Nodo del árbol binario que representa un Apu"""
@@ -508,23 +537,6 @@ for pregunta in PREGUNTAS_APUS:
     PREGUNTAS_POR_APU[pregunta["apu"]] = pregunta
 
 # ================== FUNCIONES ==================
-def load_gif_frames(gif_path):
-    """Carga todos los frames de un GIF como superficies pygame"""
-    try:
-        gif = Image.open(gif_path)
-        frames = []
-        for frame_num in range(gif.n_frames):
-            gif.seek(frame_num)
-            frame = gif.copy()
-            if frame.mode != "RGBA":
-                frame = frame.convert("RGBA")
-            frame_surface = pygame.image.fromstring(frame.tobytes(), frame.size, "RGBA")
-            frames.append(frame_surface)
-        return frames
-    except Exception as e:
-        print(f"Error cargando GIF {gif_path}: {e}")
-        return None
-
 def load_music(music_path):
     """Carga música de fondo"""
     try:
@@ -572,23 +584,39 @@ def draw_pixelated_hearts(screen, lives, max_lives, x, y):
         pygame.draw.rect(screen, color, (heart_x + 4, heart_y + 10, 12, 4))
         pygame.draw.rect(screen, color, (heart_x + 6, heart_y + 14, 8, 4))
         pygame.draw.rect(screen, color, (heart_x + 8, heart_y + 18, 4, 4))
-        
+
+    # Área ocupada por todos los corazones (para el modo de rectángulos sucios)
+    return pygame.Rect(x, y, max_lives * spacing, heart_size + 2)
+
+def interpolar_rect(rect, posicion_anterior, alpha):
+    """Copia de rect ubicada entre la posición del paso anterior y la actual
+
+    alpha = 0 -> posición anterior, alpha = 1 -> posición actual
+    """
+    x0, y0 = posicion_anterior
+    return rect.move(round((x0 - rect.x) * (1 - alpha)), round((y0 - rect.y) * (1 - alpha)))
+
 # ================== MENÚ E INSTRUCCIONES ==================
 # Las clases MainMenu e InstructionsScreen ahora están en menu.py
 # para mantener el código más organizado y modular
 
 
 # ================== CLASES DEL JUEGO ==================
+# Tamaños de los sprites (también usados para precargar sus GIFs)
+TAMANO_APU = 160
+TAMANO_ILLA = 50
+
 class Player:
     def __init__(self, x, y, gif_path=None, scale_factor=1.0):
         self.scale_factor = scale_factor
         if gif_path and os.path.exists(gif_path):
-            self.frames = load_gif_frames(gif_path)
+            size = scaled_size(gif_path, scale_factor)
+            self.frames = load_gif_frames(gif_path, size)
             if self.frames:
-                self.frames = [pygame.transform.scale(f, (int(f.get_width()*scale_factor),
-                                                          int(f.get_height()*scale_factor))) for f in self.frames]
                 self.image = self.frames[0]
                 self.original_frames = self.frames[:]
+                # Frames mirando a la izquierda, volteados una sola vez (caché compartido)
+                self.flipped_frames = load_gif_frames(gif_path, size, flip=True)
             else:
                 self.create_placeholder()
         else:
@@ -597,6 +625,7 @@ class Player:
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
+        self.posicion_anterior = self.rect.topleft  # Para dibujar interpolando entre pasos
         self.speed = 5
         self.vel_x = 0
         self.vel_y = 0
@@ -614,7 +643,7 @@ class Player:
         self.max_lives = 3
         
         self.articulos_collected = []
-        self.font = pygame.font.SysFont("Arial", 18, bold=True)
+        self.font = fuente("etiqueta")
         
         # Sistema de recolección por proximidad
         self.collection_radius = 60  # Radio para recolectar illas
@@ -631,8 +660,10 @@ class Player:
             self.frames.append(frame)
         self.image = self.frames[0]
         self.original_frames = self.frames[:]
+        self.flipped_frames = [pygame.transform.flip(f, True, False) for f in self.frames]
 
     def update(self):
+        self.posicion_anterior = self.rect.topleft
         if not self.on_ground:
             self.vel_y += self.gravity
         self.rect.x += self.vel_x
@@ -656,10 +687,9 @@ class Player:
             if self.animation_timer >= 1:
                 self.animation_timer = 0
                 self.frame_index = (self.frame_index + 1) % len(self.frames)
-                if not self.facing_right:
-                    self.image = pygame.transform.flip(self.original_frames[self.frame_index], True, False)
-                else:
-                    self.image = self.original_frames[self.frame_index]
+                # Cambiar de dirección es solo elegir el juego de frames
+                frames = self.original_frames if self.facing_right else self.flipped_frames
+                self.image = frames[self.frame_index]
         else:
             self.image = self.original_frames[0]
 
@@ -753,14 +783,26 @@ class Player:
                     return True
         return False
 
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
-        text_surface = self.font.render("Ekeko", True, WHITE)
-        text_rect = text_surface.get_rect(center=(self.rect.centerx, self.rect.top - 25))
+    def teletransportar(self, x, y):
+        """Mueve a Ekeko sin interpolar desde la posición anterior"""
+        self.rect.x = x
+        self.rect.y = y
+        self.posicion_anterior = self.rect.topleft
+
+    def draw(self, screen, alpha=1.0):
+        """Dibuja a Ekeko y retorna el rectángulo de pantalla que ocupó
+
+        alpha: fracción del paso de simulación para interpolar la posición
+        """
+        draw_rect = interpolar_rect(self.rect, self.posicion_anterior, alpha)
+        sprite_rect = screen.blit(self.image, draw_rect)
+        text_surface = render_text(self.font, "Ekeko", WHITE)
+        text_rect = text_surface.get_rect(center=(draw_rect.centerx, draw_rect.top - 25))
         screen.blit(text_surface, text_rect)
         
         # Dibujar la mochila
         self.mochila.draw(screen)
+        return sprite_rect.union(text_rect)
 
 
 class Apu:
@@ -778,7 +820,7 @@ class Apu:
         # Tamaño de Apu: doble del tamaño de Ekeko
         # Ekeko tiene scale_factor=0.1, así que su tamaño base es 40*0.1 = 4, altura 60*0.1 = 6
         # Apu será el doble: 80x120
-        self.size = 160  # Doble del tamaño original (80 -> 160)
+        self.size = TAMANO_APU  # Doble del tamaño original (80 -> 160)
         self.health = self.data["health"]
         self.max_health = self.data["health"]
         self.scene_number = scene_number
@@ -786,15 +828,17 @@ class Apu:
         apu_gif_path = f"apus/{self.data['gif']}"
         self.frames = None
         if apu_gif_path and os.path.exists(apu_gif_path):
-            self.frames = load_gif_frames(apu_gif_path)
+            self.frames = load_gif_frames(apu_gif_path, (self.size, self.size))
         if self.frames:
-            self.frames = [pygame.transform.scale(f, (self.size, self.size)) for f in self.frames]
             self.image = self.frames[0]
             self.original_frames = self.frames[:]
+            # Frames volteados una sola vez al cargar (caché compartido)
+            self.flipped_frames = load_gif_frames(apu_gif_path, (self.size, self.size), flip=True)
         else:
             self.image = pygame.Surface((self.size, self.size))
             self.image.fill(self.data["color"])
             self.original_frames = [self.image]
+            self.flipped_frames = [self.image]  # Un color sólido no necesita voltearse
 
         self.rect = self.image.get_rect()
         self.rect.x = x
@@ -802,7 +846,7 @@ class Apu:
         self.frame_index = 0
         self.animation_timer = 0
         self.animation_speed = 0.15
-        self.font = pygame.font.SysFont("Arial", 18, bold=True)
+        self.font = fuente("etiqueta")
         self.facing_right = True  # Dirección inicial del Apu
 
     def update(self):
@@ -810,17 +854,17 @@ class Apu:
         if self.animation_timer >= 1:
             self.animation_timer = 0
             self.frame_index = (self.frame_index + 1) % len(self.original_frames)
-            # Voltear el sprite según la dirección
-            if not self.facing_right:
-                self.image = pygame.transform.flip(self.original_frames[self.frame_index], True, False)
-            else:
-                self.image = self.original_frames[self.frame_index]
+            # Voltear el sprite según la dirección (sin crear superficies nuevas)
+            frames = self.original_frames if self.facing_right else self.flipped_frames
+            self.image = frames[self.frame_index]
 
     def draw(self, screen):
-        screen.blit(self.image, self.rect)
-        text_surface = self.font.render(f"Apu {self.name}", True, WHITE)
+        """Dibuja al Apu y retorna el rectángulo de pantalla que ocupó"""
+        sprite_rect = screen.blit(self.image, self.rect)
+        text_surface = render_text(self.font, f"Apu {self.name}", WHITE)
         text_rect = text_surface.get_rect(center=(self.rect.centerx, self.rect.top - 25))
         screen.blit(text_surface, text_rect)
+        return sprite_rect.union(text_rect)
 
     def give_illas_to_player(self, player, scene_number):
         """El Apu muestra las illas robadas - el jugador debe recogerlas por radio"""
@@ -841,7 +885,8 @@ class Portal:
         self.is_open = False
         self.animation_timer = 0
         self.rotation_angle = 0
-        self.font = pygame.font.SysFont("Arial", 16, bold=True)
+        self.font = fuente("portal")
+        self.font_hint = fuente("portal_pista")
 
     def open_portal(self):
         self.is_open = True
@@ -854,9 +899,12 @@ class Portal:
                 self.rotation_angle = 0
 
     def draw(self, screen):
+        """Dibuja el portal y retorna el rectángulo de pantalla que ocupó"""
         center_x = self.rect.centerx
         center_y = self.rect.centery
         radius = self.rect.width // 2
+        # El borde giratorio sobresale unos píxeles del círculo
+        area = self.rect.inflate(6, 6)
         
         if not self.is_open:
             # Portal cerrado - dibujar como un hueco oscuro pixelado
@@ -918,26 +966,29 @@ class Portal:
                 pygame.draw.rect(screen, edge_color, (edge_x - 2, edge_y - 2, 4, 4))
             
             # Texto indicativo
-            text_surface = self.font.render("¡Portal Abierto!", True, GREEN)
+            text_surface = render_text(self.font, "¡Portal Abierto!", GREEN)
             text_rect = text_surface.get_rect(center=(center_x, self.rect.bottom + 20))
             screen.blit(text_surface, text_rect)
-            hint_text = pygame.font.SysFont("Arial", 12).render("Cae dentro para continuar", True, YELLOW)
+            hint_text = render_text(self.font_hint, "Cae dentro para continuar", YELLOW)
             hint_rect = hint_text.get_rect(center=(center_x, self.rect.bottom + 40))
             screen.blit(hint_text, hint_rect)
+            area = area.unionall([text_rect, hint_rect])
+        return area
 
 
 class Articulo:
     def __init__(self, name, x, y):
         self.name = name
         # Aumentar el tamaño de las illas
-        self.size = 50  # Aumentado de 30 a 50
+        self.size = TAMANO_ILLA  # Aumentado de 30 a 50
         self.rect = pygame.Rect(x, y, self.size, self.size)
+        self.posicion_anterior = self.rect.topleft  # Para dibujar interpolando entre pasos
         self.collected = False
         self.color = (255, 255, 0)
         self.float_timer = 0
         self.base_y = y
         self.base_x = x
-        self.font = pygame.font.SysFont("Arial", 14, bold=True)  # Fuente más grande
+        self.font = fuente("illa")  # Fuente más grande
         
         # Variables para animación de giro y movimiento
         self.rotation_angle = 0
@@ -947,6 +998,7 @@ class Articulo:
         self.move_timer = 0
         
         self.frames = None
+        self.gif_path = None
         self.current_frame = 0
         self.animation_timer = 0
         self.animation_speed = 0.1
@@ -954,12 +1006,12 @@ class Articulo:
         if name in ILLAS_GIFS:
             gif_path = ILLAS_GIFS[name]
             if os.path.exists(gif_path):
-                self.frames = load_gif_frames(gif_path)
-                if self.frames:
-                    # Aumentar el tamaño de los frames
-                    self.frames = [pygame.transform.scale(f, (self.size, self.size)) for f in self.frames]
+                # Frames escalados al tamaño de la illa (desde el caché compartido)
+                self.frames = load_gif_frames(gif_path, (self.size, self.size))
+                self.gif_path = gif_path
 
     def update(self):
+        self.posicion_anterior = self.rect.topleft
         if not self.collected:
             # Animación de flotación vertical
             self.float_timer += 0.1
@@ -981,33 +1033,39 @@ class Articulo:
                     self.animation_timer = 0
                     self.current_frame = (self.current_frame + 1) % len(self.frames)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        """Dibuja la illa y retorna el rectángulo que ocupó (None si ya fue recolectada)
+
+        alpha: fracción del paso de simulación para interpolar la posición
+        """
         if not self.collected:
+            draw_rect = interpolar_rect(self.rect, self.posicion_anterior, alpha)
             if self.frames:
-                # Aplicar rotación al frame actual
-                rotated_frame = pygame.transform.rotate(self.frames[self.current_frame], self.rotation_angle)
-                frame_rect = rotated_frame.get_rect(center=self.rect.center)
-                screen.blit(rotated_frame, frame_rect)
+                # Frame rotado desde el caché compartido de rotaciones
+                frame_rotado = rotated_frame(self.gif_path, (self.size, self.size),
+                                             self.current_frame, self.rotation_angle)
+                frame_rect = frame_rotado.get_rect(center=draw_rect.center)
+                screen.blit(frame_rotado, frame_rect)
             else:
+                frame_rect = draw_rect.copy()
                 # Dibujar círculo con rotación visual
-                pygame.draw.circle(screen, self.color, self.rect.center, self.size // 2)
-                pygame.draw.circle(screen, WHITE, self.rect.center, self.size // 2, 3)
+                pygame.draw.circle(screen, self.color, draw_rect.center, self.size // 2)
+                pygame.draw.circle(screen, WHITE, draw_rect.center, self.size // 2, 3)
                 
                 # Dibujar efecto de giro con líneas
-                center_x, center_y = self.rect.center
+                center_x, center_y = draw_rect.center
                 for i in range(0, 360, 45):
                     angle_rad = math.radians(i + self.rotation_angle)
                     end_x = center_x + int((self.size // 3) * math.cos(angle_rad))
                     end_y = center_y + int((self.size // 3) * math.sin(angle_rad))
                     pygame.draw.line(screen, WHITE, (center_x, center_y), (end_x, end_y), 2)
             
-            # Texto con sombra para mejor visibilidad
-            text_surface = self.font.render(self.name, True, WHITE)
-            text_shadow = self.font.render(self.name, True, BLACK)
-            text_rect = text_surface.get_rect(center=(self.rect.centerx, self.rect.bottom + 15))
-            shadow_rect = text_shadow.get_rect(center=(self.rect.centerx + 1, self.rect.bottom + 16))
-            screen.blit(text_shadow, shadow_rect)
+            # Texto con sombra para mejor visibilidad (una sola superficie)
+            text_surface = render_text_shadow(self.font, self.name, WHITE, BLACK, (1, 1))
+            text_rect = text_surface.get_rect(center=(draw_rect.centerx, draw_rect.bottom + 15))
             screen.blit(text_surface, text_rect)
+            return frame_rect.union(text_rect)
+        return None
 
 class MochilaVisual:
     """Clase para la mochila visual donde se guardan las illas recolectadas"""
@@ -1017,8 +1075,8 @@ class MochilaVisual:
         self.x = (SCREEN_WIDTH - self.width) // 2  # Centrado horizontalmente
         self.y = (SCREEN_HEIGHT - self.height) // 2  # Centrado verticalmente
         self.illas_guardadas = []
-        self.font = pygame.font.SysFont("Arial", 14, bold=True)
-        self.font_small = pygame.font.SysFont("Arial", 12)
+        self.font = fuente("mochila")
+        self.font_small = fuente("mochila_pequena")
         
         # Estado de mostrar/ocultar mochila
         self.mostrar_mochila = False
@@ -1027,9 +1085,8 @@ class MochilaVisual:
         self.mochila_gif = None
         mochila_path = "mochila.gif"  # Ruta actualizada
         if os.path.exists(mochila_path):
-            self.mochila_frames = load_gif_frames(mochila_path)
+            self.mochila_frames = load_gif_frames(mochila_path, (self.width, self.height))
             if self.mochila_frames:
-                self.mochila_frames = [pygame.transform.scale(f, (self.width, self.height)) for f in self.mochila_frames]
                 self.current_frame = 0
                 self.animation_timer = 0
                 self.animation_speed = 0.1
@@ -1056,13 +1113,12 @@ class MochilaVisual:
             if illa_name in ILLAS_GIFS:
                 gif_path = ILLAS_GIFS[illa_name]
                 if os.path.exists(gif_path):
-                    frames = load_gif_frames(gif_path)
+                    # Redimensionar frames para la mochila
+                    size_illa = 40  # Tamaño de illa en la mochila
+                    frames = load_gif_frames(gif_path, (size_illa, size_illa))
                     if frames:
-                        # Redimensionar frames para la mochila
-                        size_illa = 40  # Tamaño de illa en la mochila
-                        frames_resized = [pygame.transform.scale(f, (size_illa, size_illa)) for f in frames]
                         self.illas_gifs_cache[illa_name] = {
-                            'frames': frames_resized,
+                            'frames': frames,
                             'current_frame': 0,
                             'animation_timer': 0,
                             'animation_speed': 0.1
@@ -1097,11 +1153,8 @@ class MochilaVisual:
         if not self.mostrar_mochila:
             return
         
-        # Crear fondo semi-transparente
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        # Fondo semi-transparente (capa compartida)
+        screen.blit(capa_translucida((SCREEN_WIDTH, SCREEN_HEIGHT), 150), (0, 0))
         
         # Dibujar fondo de la mochila
         mochila_rect = pygame.Rect(self.x, self.y, self.width, self.height)
@@ -1113,13 +1166,13 @@ class MochilaVisual:
             screen.blit(self.mochila_frames[self.current_frame], (self.x, self.y))
         
         # Título de la mochila
-        title_text = self.font.render("MOCHILA DE EKEKO", True, WHITE)
+        title_text = render_text(self.font, "MOCHILA DE EKEKO", WHITE)
         title_rect = title_text.get_rect(center=(self.x + self.width // 2, self.y + 20))
         screen.blit(title_text, title_rect)
         
         # Contador de illas
         illas_text = f"Illas Recolectadas: {len(self.illas_guardadas)}/19"
-        count_text = self.font_small.render(illas_text, True, YELLOW)
+        count_text = render_text(self.font_small, illas_text, YELLOW)
         count_rect = count_text.get_rect(center=(self.x + self.width // 2, self.y + 45))
         screen.blit(count_text, count_rect)
         
@@ -1148,24 +1201,24 @@ class MochilaVisual:
                     pygame.draw.circle(screen, WHITE, (x + 20, y + 20), 20, 2)
                 
                 # Dibujar nombre de la illa
-                nombre_text = self.font_small.render(illa_name, True, WHITE)
+                nombre_text = render_text(self.font_small, illa_name, WHITE)
                 nombre_rect = nombre_text.get_rect(center=(x + 20, y + 45))
                 screen.blit(nombre_text, nombre_rect)
                 
                 # Si hay muchas illas, mostrar scroll
                 if fila >= 4:  # Máximo 4 filas visibles
-                    scroll_text = self.font_small.render("...", True, GRAY)
+                    scroll_text = render_text(self.font_small, "...", GRAY)
                     scroll_rect = scroll_text.get_rect(center=(self.x + self.width // 2, y + 30))
                     screen.blit(scroll_text, scroll_rect)
                     break
         else:
             # Mensaje cuando no hay illas
-            empty_text = self.font_small.render("No hay illas recolectadas", True, GRAY)
+            empty_text = render_text(self.font_small, "No hay illas recolectadas", GRAY)
             empty_rect = empty_text.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
             screen.blit(empty_text, empty_rect)
         
         # Instrucciones para cerrar
-        close_text = self.font_small.render("Presiona J para cerrar la mochila", True, WHITE)
+        close_text = render_text(self.font_small, "Presiona J para cerrar la mochila", WHITE)
         close_rect = close_text.get_rect(center=(self.x + self.width // 2, self.y + self.height - 20))
         screen.blit(close_text, close_rect)
             
@@ -1174,9 +1227,9 @@ class MochilaVisual:
 class QuestionScreen:
     def __init__(self, pregunta_data):
         self.pregunta_data = pregunta_data
-        self.font_title = pygame.font.SysFont("Arial", 24, bold=True)
-        self.font_question = pygame.font.SysFont("Arial", 18)
-        self.font_options = pygame.font.SysFont("Arial", 16)
+        self.font_title = fuente("pregunta_titulo")
+        self.font_question = fuente("pregunta")
+        self.font_options = fuente("pregunta_opciones")
         self.selected_option = 0
         self.answered = False
         self.correct = False
@@ -1205,19 +1258,16 @@ class QuestionScreen:
             self.result_timer -= 1
 
     def draw(self, screen):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(capa_translucida((SCREEN_WIDTH, SCREEN_HEIGHT), 200), (0, 0))
 
-        apu_text = self.font_title.render(f"Apu {self.pregunta_data['apu']} te pregunta:", True, WHITE)
+        apu_text = render_text(self.font_title, f"Apu {self.pregunta_data['apu']} te pregunta:", WHITE)
         apu_rect = apu_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
         screen.blit(apu_text, apu_rect)
 
         question_lines = self.wrap_text(self.pregunta_data["pregunta"], self.font_question, SCREEN_WIDTH - 100)
         y_offset = 150
         for line in question_lines:
-            text_surface = self.font_question.render(line, True, WHITE)
+            text_surface = render_text(self.font_question, line, WHITE)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             screen.blit(text_surface, text_rect)
             y_offset += 25
@@ -1227,12 +1277,12 @@ class QuestionScreen:
             for i, opcion in enumerate(self.pregunta_data["opciones"]):
                 color = YELLOW if i == self.selected_option else WHITE
                 option_text = f"{chr(65 + i)}) {opcion}"
-                text_surface = self.font_options.render(option_text, True, color)
+                text_surface = render_text(self.font_options, option_text, color)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
                 screen.blit(text_surface, text_rect)
                 y_offset += 30
 
-            instr_text = self.font_options.render("Usa ↑↓ para seleccionar, ENTER para confirmar", True, GRAY)
+            instr_text = render_text(self.font_options, "Usa ↑↓ para seleccionar, ENTER para confirmar", GRAY)
             instr_rect = instr_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
             screen.blit(instr_text, instr_rect)
 
@@ -1244,14 +1294,14 @@ class QuestionScreen:
                 result_text = "¡INCORRECTO! Pierdes una vida"
                 color = RED
             
-            text_surface = self.font_title.render(result_text, True, color)
+            text_surface = render_text(self.font_title, result_text, color)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             screen.blit(text_surface, text_rect)
 
             if self.correct:
                 correct_answer = self.pregunta_data["opciones"][self.pregunta_data["respuesta_correcta"]]
                 answer_text = f"Respuesta: {correct_answer}"
-                answer_surface = self.font_question.render(answer_text, True, WHITE)
+                answer_surface = render_text(self.font_question, answer_text, WHITE)
                 answer_rect = answer_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
                 screen.blit(answer_surface, answer_rect)
 
@@ -1301,6 +1351,9 @@ class GameScene:
         self.player_can_advance = False
         self.illas_message = ""
         self.illas_message_timer = 0
+        self.font = fuente("hud")
+        self.font_message = fuente("hud_mensaje")
+        self.font_hint = fuente("hud_pista")
         
         # Crear artículos visibles que flotan en la escena
         self.artikulos_visuales = []
@@ -1331,6 +1384,7 @@ class GameScene:
                 pregunta_data = PREGUNTAS_POR_APU[self.apu_name]
                 self.question_screen = QuestionScreen(pregunta_data)
                 self.showing_question = True
+                traza.instante("pregunta_abierta", "pregunta", apu=self.apu_name)
             else:
                 print(f"⚠️ No se encontró pregunta para el Apu: {self.apu_name}")
                 # Usar pregunta por defecto si no se encuentra
@@ -1342,12 +1396,15 @@ class GameScene:
                 }
                 self.question_screen = QuestionScreen(pregunta_data)
                 self.showing_question = True
+                traza.instante("pregunta_abierta", "pregunta", apu=self.apu_name)
 
     def handle_event(self, event, player):
         if self.showing_question and self.question_screen:
             self.question_screen.handle_input(event)
             
             if self.question_screen.is_finished():
+                traza.instante("pregunta_cerrada", "pregunta", apu=self.apu_name,
+                               correcta=self.question_screen.correct)
                 if self.question_screen.correct:
                     self.completed = True
                     self.portal.open_portal()
@@ -1412,40 +1469,40 @@ class GameScene:
             if self.apu.rect.colliderect(player.rect):
                 self.start_question()
 
-    def draw(self, screen, player):
-        font = pygame.font.SysFont("Arial", 20, bold=True)
+    def draw(self, screen, player, alpha=1.0):
+        """Dibuja la escena y retorna la lista de rectángulos de pantalla que pintó
+
+        alpha: fracción del paso de simulación para interpolar las illas
+        """
         # Obtener el bioma del Apu usando el árbol binario o fallback
         if hasattr(self, 'apu') and hasattr(self.apu, 'data'):
             bioma = self.apu.data.get('bioma', 'Desconocido')
         else:
             bioma = APUS_DATA.get(self.apu_name, {}).get('bioma', 'Desconocido')
         
-        scene_text = font.render(f"Escena {self.scene_number + 1}/14 - {bioma}", True, WHITE)
-        screen.blit(scene_text, (10, 10))
+        scene_text = render_text(self.font, f"Escena {self.scene_number + 1}/14 - {bioma}", WHITE)
+        rects = [screen.blit(scene_text, (10, 10))]
         
-        draw_pixelated_hearts(screen, player.lives, player.max_lives, 10, 40)
+        rects.append(draw_pixelated_hearts(screen, player.lives, player.max_lives, 10, 40))
         
-        illas_text = font.render(f"Illas Recuperadas: {len(player.articulos_collected)}/19", True, WHITE)
-        screen.blit(illas_text, (10, 80))
+        illas_text = render_text(self.font, f"Illas Recuperadas: {len(player.articulos_collected)}/19", WHITE)
+        rects.append(screen.blit(illas_text, (10, 80)))
         
         if self.illas_message_timer > 0:
-            message_font = pygame.font.SysFont("Arial", 18, bold=True)
-            message_surface = message_font.render(self.illas_message, True, GREEN)
+            message_surface = render_text(self.font_message, self.illas_message, GREEN)
             message_rect = message_surface.get_rect(center=(SCREEN_WIDTH // 2, 120))
             
             padding = 10
             bg_rect = pygame.Rect(message_rect.x - padding, message_rect.y - padding,
                                 message_rect.width + 2*padding, message_rect.height + 2*padding)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-            bg_surface.set_alpha(180)
-            bg_surface.fill(BLACK)
-            screen.blit(bg_surface, bg_rect)
+            screen.blit(capa_translucida(bg_rect.size, 180), bg_rect)
             
             screen.blit(message_surface, message_rect)
+            rects.append(bg_rect)
         
         # Dibujar artículos visuales flotantes con animación
         for articulo in self.artikulos_visuales:
-            articulo.draw(screen)
+            rects.append(articulo.draw(screen, alpha))
             
             # Dibujar indicador de proximidad si está cerca del jugador
             if not articulo.collected:
@@ -1453,21 +1510,21 @@ class GameScene:
                                   (player.rect.centery - articulo.rect.centery)**2)
                 if distance <= player.collection_radius:
                     # Dibujar círculo de proximidad
-                    pygame.draw.circle(screen, (255, 255, 0), articulo.rect.center, 
-                                     player.collection_radius, 2)
+                    rects.append(pygame.draw.circle(screen, (255, 255, 0), articulo.rect.center, 
+                                     player.collection_radius, 2))
                     # Dibujar texto de instrucción
-                    collect_text = pygame.font.SysFont("Arial", 12, bold=True).render(
-                        "¡Acércate para recolectar!", True, YELLOW)
+                    collect_text = render_text(self.font_hint, "¡Acércate para recolectar!", YELLOW)
                     collect_rect = collect_text.get_rect(center=(articulo.rect.centerx, 
                                                                articulo.rect.top - 30))
-                    screen.blit(collect_text, collect_rect)
+                    rects.append(screen.blit(collect_text, collect_rect))
         
         if not self.completed:
-            self.apu.draw(screen)
-        self.portal.draw(screen)
+            rects.append(self.apu.draw(screen))
+        rects.append(self.portal.draw(screen))
         
         if self.showing_question and self.question_screen:
             self.question_screen.draw(screen)
+        return rects
 
     def can_advance(self, player):
         # El jugador cae en el portal para avanzar
@@ -1487,16 +1544,67 @@ class GameScene:
         return False
 
 
+class VentanaEscenas:
+    """Construye las escenas bajo demanda y conserva solo una ventana acotada
+
+    FUNCIONAMIENTO DE LA VENTANA:
+    - Al pedir una escena: se construye recién en ese momento (Apu, illas y GIFs)
+    - Al avanzar: las escenas ya superadas se descartan
+    - Solo se conservan la escena actual y las siguientes dentro del tamaño de la ventana
+    """
+    def __init__(self, fabrica, total, tamano=2):
+        self.fabrica = fabrica  # Función que construye la escena de un índice
+        self.total = total
+        self.tamano = tamano  # Escena actual + siguiente
+        self.actual = 0
+        self._escenas = {}
+
+    def __len__(self):
+        return self.total
+
+    def __getitem__(self, indice):
+        if not 0 <= indice < self.total:
+            raise IndexError(f"Escena {indice} fuera de rango")
+        escena = self._escenas.get(indice)
+        if escena is None:
+            escena = self.fabrica(indice)
+            self._escenas[indice] = escena
+            self._recortar()
+        return escena
+
+    def precargar(self, indice):
+        """Construye por adelantado una escena si cae dentro de la ventana"""
+        if indice < self.total and self.actual <= indice < self.actual + self.tamano:
+            self[indice]
+
+    def avanzar_a(self, indice):
+        """Mueve la ventana a la escena indicada y libera las escenas pasadas"""
+        self.actual = indice
+        self._recortar()
+
+    def _recortar(self):
+        for indice in list(self._escenas):
+            if not self.actual <= indice < self.actual + self.tamano:
+                del self._escenas[indice]
+
+
 class AnimatedBackground:
     def __init__(self, scene_number=0):
         self.scene_number = scene_number
         
         bioma_gif_path = BIOMA_GIFS[scene_number] if scene_number < len(BIOMA_GIFS) else None
+        self.gif_path = bioma_gif_path
         
+        self.streaming = None
         if bioma_gif_path and os.path.exists(bioma_gif_path):
-            self.frames = load_gif_frames(bioma_gif_path)
+            if FONDOS_EN_STREAMING:
+                # Un solo frame a la vez en self.frames; el resto llega del hilo de streaming
+                primer_frame = self.abrir_streaming()
+                self.frames = [primer_frame] if primer_frame else None
+            else:
+                self.frames = load_gif_frames(bioma_gif_path, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                              paleta=FONDOS_EN_PALETA)
             if self.frames:
-                self.frames = [pygame.transform.scale(f, (SCREEN_WIDTH, SCREEN_HEIGHT)) for f in self.frames]
                 self.current_frame = 0
                 self.animation_speed = 0.1
                 self.animation_timer = 0
@@ -1504,11 +1612,18 @@ class AnimatedBackground:
                 print(f"🏔️ Cargado fondo animado: {bioma_gif_path}")
             else:
                 print(f"❌ Error cargando GIF: {bioma_gif_path}")
+                self.cerrar()
                 self.create_biome_background()
         else:
             print(f"📁 GIF no encontrado: {bioma_gif_path if bioma_gif_path else 'N/A'}, usando fondo estático")
             self.create_biome_background()
 
+    def abrir_streaming(self):
+        """Empieza a decodificar el GIF en streaming; retorna el primer frame"""
+        self.streaming = GifEnStreaming(self.gif_path, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                        FRAMES_FONDO_EN_MEMORIA, paleta=FONDOS_EN_PALETA)
+        return self.streaming.siguiente()
+
     def create_biome_background(self):
         self.use_gif = False
         self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -1543,7 +1658,10 @@ class AnimatedBackground:
             self.animation_timer += self.animation_speed
             if self.animation_timer >= 1:
                 self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.frames)
+                if self.streaming:
+                    self.frames[0] = self.streaming.siguiente()
+                else:
+                    self.current_frame = (self.current_frame + 1) % len(self.frames)
 
     def draw(self, screen):
         if self.use_gif:
@@ -1551,37 +1669,186 @@ class AnimatedBackground:
         else:
             screen.blit(self.background, (0, 0))
 
+    def reiniciar_animacion(self):
+        """Vuelve al primer frame del GIF"""
+        if not self.use_gif:
+            return
+        self.animation_timer = 0
+        if self.streaming:
+            self.streaming.cerrar()
+            self.frames[0] = self.abrir_streaming() or self.frames[0]
+        else:
+            self.current_frame = 0
+
+    def cerrar(self):
+        """Detiene el streaming del fondo (llamar antes de descartarlo)"""
+        if self.streaming:
+            self.streaming.cerrar()
+            self.streaming = None
+
+
+class PoolFondos:
+    """Comparte los fondos animados entre las escenas que usan el mismo GIF
+
+    FUNCIONAMIENTO DEL POOL:
+    - Clave: ruta real del GIF del bioma. Los fondos estáticos (GIF inexistente)
+      no se comparten porque su color depende de la escena
+    - Referencias: cada escena desde la actual hasta la última cuenta una
+      referencia al fondo que usa; al avanzar, las escenas superadas la sueltan
+    - Un fondo sin referencias se cierra (hilo de streaming) y sus frames salen del caché
+    - Con CONTINUAR_ANIMACION_FONDO un fondo reutilizado sigue donde quedó
+    """
+    def __init__(self, total):
+        self.total = total
+        self.referencias = {}  # ruta real -> escenas pendientes que usan ese GIF
+        self._fondos = {}      # ruta real -> AnimatedBackground
+
+    @staticmethod
+    def clave(scene_number):
+        """Ruta real del GIF de la escena, o None si la escena usa fondo estático"""
+        if scene_number < len(BIOMA_GIFS) and os.path.exists(BIOMA_GIFS[scene_number]):
+            return os.path.realpath(BIOMA_GIFS[scene_number])
+        return None
+
+    def avanzar_a(self, scene_number):
+        """Retorna el fondo de la escena y libera los que ya no usa ninguna escena pendiente"""
+        self.referencias = {}
+        for indice in range(scene_number, self.total):
+            clave = self.clave(indice)
+            if clave:
+                self.referencias[clave] = self.referencias.get(clave, 0) + 1
+        for clave in [clave for clave in self._fondos if clave not in self.referencias]:
+            self._liberar(clave)
+
+        clave = self.clave(scene_number)
+        fondo = self._fondos.get(clave)
+        if fondo is not None:
+            print(f"♻️ Fondo reutilizado: {fondo.gif_path} (escenas pendientes: {self.referencias[clave]})")
+            if not CONTINUAR_ANIMACION_FONDO:
+                fondo.reiniciar_animacion()
+            return fondo
+        fondo = AnimatedBackground(scene_number=scene_number)
+        if clave and fondo.use_gif:
+            self._fondos[clave] = fondo
+        return fondo
+
+    def _liberar(self, clave):
+        fondo = self._fondos.pop(clave)
+        fondo.cerrar()
+        descartar_gif(fondo.gif_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        print(f"🧹 Fondo liberado: {fondo.gif_path}")
+
+    def tiene(self, scene_number):
+        """True si el fondo de la escena ya está en el pool"""
+        return self.clave(scene_number) in self._fondos
+
+    def cerrar(self):
+        """Cierra todos los fondos del pool"""
+        for clave in list(self._fondos):
+            self._liberar(clave)
+
 
 # ================== GAME MANAGER ==================
 class GameManager:
     def __init__(self):
         self.current_scene = 0
         self.total_scenes = 14  # Actualizado a 14 Apus
-        self.scenes = []
         self.player = Player(100, SCREEN_HEIGHT - 250, gif_path="ekeko.gif", scale_factor=0.1)
-        self.background = AnimatedBackground(scene_number=0)
+        # ✅ Fondos compartidos entre escenas con el mismo bioma
+        self.fondos = PoolFondos(self.total_scenes)
+        self.background = self.fondos.avanzar_a(0)
         self.game_state = "MENU"  # 👉 empieza en menú
-        self.font_big = pygame.font.SysFont("Arial", 36, bold=True)
-        self.font_medium = pygame.font.SysFont("Arial", 24, bold=True)
+        self.font_big = fuente("grande")
+        self.font_medium = fuente("mediana")
 
         # ✅ Árbol binario de Apus
         self.arbol_apus = ArbolApus()
         self.poblar_arbol_apus()  # Poblar el árbol con los 14 Apus
 
-        # ✅ Menú principal (usando archivo separado)
-        from menu import MainMenu
+        # ✅ Menú principal e instrucciones (usando archivo separado)
+        from menu import MainMenu, InstructionsScreen
         self.main_menu = MainMenu(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.instructions_screen = InstructionsScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # ✅ Escenas (construidas bajo demanda usando el árbol binario)
+        self.scenes = VentanaEscenas(self.crear_escena, self.total_scenes)
+
+        # ✅ Precarga en segundo plano de los recursos de la siguiente escena
+        self.precargador = PrecargadorRecursos()
+        self.escena_precargada = None
+
+        # ✅ Rectángulos sucios: con fondo estático solo se repinta lo que se movió
+        self.renderizador = RenderizadorRectangulos()
+        self.rectangulos_sucios = True
+
+        # ✅ Pantallas finales compuestas una sola vez (game over y victoria)
+        self._capas_finales = {}
+        self._pantalla_final = None
+        self._clave_pantalla_final = None
+
+        # ✅ Ritmo del bucle principal según el estado
+        self.planificador = PlanificadorFrames(FPS_POR_ESTADO, fps_defecto=FPS)
+        self.alpha_interpolacion = 1.0  # 1.0 = dibujar en la posición del último paso
 
-        # ✅ Escenas (ahora usando el árbol binario)
-        for i in range(self.total_scenes):
-            self.scenes.append(GameScene(i, self.arbol_apus))
+        # ✅ Estado del teclado: la simulación sin pantalla lo reemplaza por teclas guionadas
+        self.leer_teclas = pygame.key.get_pressed
+        self.tick = 0  # Pasos de simulación desde el inicio (para grabar y repetir partidas)
 
         # ✅ Música
         self.current_music = None
         self.load_menu_music()  # 🎵 suena música del menú apenas inicia
 
+        # ✅ Autoverificación: todos los GIFs cargados deben estar en formato de pantalla
+        # (antes se convierten los que se hayan cargado sin pantalla)
+        convertir_pendientes()
+        verificar_formato_pantalla()
 
 
+
+    def crear_escena(self, scene_number):
+        """Fábrica de escenas usada por la ventana de escenas"""
+        with traza.tramo("crear_escena", "escena", escena=scene_number + 1):
+            return GameScene(scene_number, self.arbol_apus)
+
+    def recursos_de_escena(self, scene_number):
+        """Lista de (gif, tamaño) que necesita una escena: fondo, Apu e illas
+
+        Con FONDOS_EN_STREAMING el fondo no se precarga: lo decodifica su propio hilo.
+        Tampoco si el pool ya tiene el fondo de ese bioma.
+        """
+        peticiones = []
+        if (scene_number < len(BIOMA_GIFS) and not FONDOS_EN_STREAMING
+                and not self.fondos.tiene(scene_number)):
+            peticiones.append((BIOMA_GIFS[scene_number], (SCREEN_WIDTH, SCREEN_HEIGHT), FONDOS_EN_PALETA))
+        apu_nodo = self.arbol_apus.obtener_apu_por_indice(scene_number)
+        if apu_nodo:
+            peticiones.append((f"apus/{apu_nodo.datos['gif']}", (TAMANO_APU, TAMANO_APU)))
+        for illa_name in ILLAS_ROBADAS_POR_ESCENA[scene_number]:
+            if illa_name in ILLAS_GIFS:
+                peticiones.append((ILLAS_GIFS[illa_name], (TAMANO_ILLA, TAMANO_ILLA)))
+        return peticiones
+
+    def recursos_del_juego(self):
+        """Lista de (gif, tamaño) de una partida completa: Ekeko, mochila y todas las escenas"""
+        peticiones = [("ekeko.gif", scaled_size("ekeko.gif", 0.1)), ("ekeko.gif", (120, 120))]
+        peticiones += [(gif, (40, 40)) for gif in ILLAS_GIFS.values()]  # Illas en la mochila
+        for scene_number in range(self.total_scenes):
+            peticiones += self.recursos_de_escena(scene_number)
+        return list(dict.fromkeys(peticiones))
+
+    def precargar_siguiente_escena(self):
+        """Empieza a decodificar la siguiente escena en cuanto la actual se completa"""
+        siguiente = self.current_scene + 1
+        if siguiente >= self.total_scenes:
+            return
+        if self.escena_precargada != siguiente:
+            self.escena_precargada = siguiente
+            self.precargador.solicitar(self.recursos_de_escena(siguiente))
+            print(f"⏳ Precargando recursos de la escena {siguiente + 1}")
+        elif not self.precargador.ocupado():
+            # Con los GIFs ya en caché, construir la escena es inmediato
+            self.scenes.precargar(siguiente)
+
     def poblar_arbol_apus(self):
         """Poblar el árbol binario con los 14 Apus del juego usando clases específicas"""
         print("🌳 Poblando árbol binario con los 14 Apus usando clases específicas...")
@@ -1664,6 +1931,10 @@ class GameManager:
 
     def load_biome_music(self, scene_number):
         """Carga la música del bioma correspondiente a la escena"""
+        with traza.tramo("load_biome_music", "musica", escena=scene_number + 1):
+            self._load_biome_music(scene_number)
+
+    def _load_biome_music(self, scene_number):
         if scene_number < len(BIOMA_MUSIC):
             music_path = BIOMA_MUSIC[scene_number]
             if os.path.exists(music_path) and music_path != self.current_music:
@@ -1694,9 +1965,6 @@ class GameManager:
                 return "QUIT"
                 
         elif self.game_state == "INSTRUCTIONS":
-            if not hasattr(self, 'instructions_screen'):
-                from menu import InstructionsScreen
-                self.instructions_screen = InstructionsScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
             instr_result = self.instructions_screen.handle_input(event)
             if instr_result == "BACK":
                 self.game_state = "MENU"
@@ -1724,7 +1992,10 @@ class GameManager:
         if self.game_state == "MENU":
             self.main_menu.update()
         elif self.game_state == "PLAYING":
-            keys = pygame.key.get_pressed()
+            # Recibir los GIFs que el hilo de precarga ya terminó
+            self.precargador.recoger()
+
+            keys = self.leer_teclas()
             self.player.handle_input(keys)
             self.player.update()
             
@@ -1733,17 +2004,35 @@ class GameManager:
             
             self.scenes[self.current_scene].update(self.player)
             
+            if self.scenes[self.current_scene].completed:
+                self.precargar_siguiente_escena()
+            
             if self.scenes[self.current_scene].can_advance(self.player):
                 self.advance_to_next_scene()
             
             self.background.update()
 
+    def simular(self, ticks):
+        """Avanza la simulación `ticks` pasos fijos de 1/60 s sin dibujar
+
+        Sirve también para correr el juego más rápido que el tiempo real (pruebas).
+        """
+        for _ in range(ticks):
+            self.update()
+            self.tick += 1
+
     def advance_to_next_scene(self):
+        traza.instante("fin_de_escena", "escena", escena=self.current_scene + 1)
+        with traza.tramo("advance_to_next_scene", "escena", desde=self.current_scene + 1):
+            self._advance_to_next_scene()
+
+    def _advance_to_next_scene(self):
      if self.current_scene < self.total_scenes - 1:
         self.current_scene += 1
-        self.player.rect.x = 100
-        self.player.rect.y = SCREEN_HEIGHT - 250
-        self.background = AnimatedBackground(scene_number=self.current_scene)
+        self.precargador.completar()  # Lo que no empezó a tiempo se carga de forma síncrona
+        self.scenes.avanzar_a(self.current_scene)  # Libera la escena superada
+        self.player.teletransportar(100, SCREEN_HEIGHT - 250)
+        self.background = self.fondos.avanzar_a(self.current_scene)
 
         self.load_biome_music(self.current_scene)  # 🎵 cambia música
      else:
@@ -1758,14 +2047,19 @@ class GameManager:
 
     def restart_game(self):
         """Reinicia el juego completamente"""
+        with traza.tramo("restart_game", "escena"):
+            self._restart_game()
+
+    def _restart_game(self):
         self.current_scene = 0
+        self.precargador.cancelar()
+        self.escena_precargada = None
         self.player = Player(100, SCREEN_HEIGHT - 250, gif_path="ekeko.gif", scale_factor=0.1)
-        self.background = AnimatedBackground(scene_number=0)
+        self.background = self.fondos.avanzar_a(0)
         
-        # Recrear las escenas usando el árbol binario
-        self.scenes = []
-        for i in range(self.total_scenes):
-            self.scenes.append(GameScene(i, self.arbol_apus))
+        # Recrear las escenas usando el árbol binario (solo se construye la primera)
+        self.scenes = VentanaEscenas(self.crear_escena, self.total_scenes)
+        self.scenes[0]
 
     def draw(self, screen):
         if self.game_state == "MENU":
@@ -1773,21 +2067,11 @@ class GameManager:
             
         elif self.game_state == "INSTRUCTIONS":
             self.main_menu.draw(screen)  # Fondo del menú
-            from menu import InstructionsScreen
-            if not hasattr(self, 'instructions_screen'):
-                self.instructions_screen = InstructionsScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
             self.instructions_screen.draw(screen)
             
         elif self.game_state == "PLAYING":
             self.background.draw(screen)
-            self.player.draw(screen)
-            self.scenes[self.current_scene].draw(screen, self.player)
-            
-            # Dibujar mochila si está abierta
-            self.player.mochila.draw(screen)
-            
-            progress_text = self.font_medium.render(f"Progreso: {self.current_scene + 1}/14", True, WHITE)
-            screen.blit(progress_text, (SCREEN_WIDTH - 200, 10))
+            self.draw_playing_layer(screen)
             
         elif self.game_state == "GAME_OVER":
             self.draw_game_over(screen)
@@ -1795,11 +2079,43 @@ class GameManager:
         elif self.game_state == "VICTORY":
             self.draw_victory(screen)
     
+    def draw_playing_layer(self, screen):
+        """Dibuja todo lo que va sobre el fondo en PLAYING y retorna los rectángulos pintados"""
+        rects = [self.player.draw(screen, self.alpha_interpolacion)]
+        rects.extend(self.scenes[self.current_scene].draw(screen, self.player, self.alpha_interpolacion))
+        
+        # Dibujar mochila si está abierta
+        self.player.mochila.draw(screen)
+        
+        progress_text = render_text(self.font_medium, f"Progreso: {self.current_scene + 1}/14", WHITE)
+        rects.append(screen.blit(progress_text, (SCREEN_WIDTH - 200, 10)))
+        return rects
+
+    def puede_usar_rectangulos_sucios(self):
+        """True si el frame se puede presentar solo con los rectángulos que cambiaron
+
+        Hace falta un fondo estático y nada que cubra toda la pantalla
+        (fondo GIF animado, mochila abierta o pregunta en curso).
+        """
+        if not self.rectangulos_sucios or self.game_state != "PLAYING":
+            return False
+        if self.background.use_gif or self.player.mochila.mostrar_mochila:
+            return False
+        return not self.scenes[self.current_scene].showing_question
+
+    def render(self, screen):
+        """Dibuja el estado actual y lo presenta en pantalla"""
+        if self.puede_usar_rectangulos_sucios():
+            self.renderizador.presentar(screen, self.background.background, self.draw_playing_layer)
+        else:
+            self.draw(screen)
+            self.renderizador.presentar_completo()
+
     def draw_credits(self, screen, y_start):
         """Dibuja los créditos del juego"""
-        font_credits_title = pygame.font.SysFont("Arial", 24, bold=True)
-        font_credits = pygame.font.SysFont("Arial", 18)
-        font_credits_small = pygame.font.SysFont("Arial", 16)
+        font_credits_title = fuente("creditos_titulo")
+        font_credits = fuente("creditos")
+        font_credits_small = fuente("creditos_pequena")
         
         y = y_start
         
@@ -1833,65 +2149,75 @@ class GameManager:
     
     def draw_game_over(self, screen):
         """Dibuja la pantalla de game over con créditos"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
-        
-        game_over_text = self.font_big.render("¡GAME OVER!", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        screen.blit(game_over_text, game_over_rect)
-        
-        score_text = self.font_medium.render(f"Llegaste hasta la escena {self.current_scene + 1}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 130))
-        screen.blit(score_text, score_rect)
-        
-        articles_text = self.font_medium.render(f"Illas recuperadas: {len(self.player.articulos_collected)}/19", True, WHITE)
-        articles_rect = articles_text.get_rect(center=(SCREEN_WIDTH // 2, 160))
-        screen.blit(articles_text, articles_rect)
-        
-        # Dibujar créditos
-        y_credits = self.draw_credits(screen, 220)
-        
-        # Botón de menú
-        menu_text = self.font_medium.render("Presiona 'M' o ENTER para ir al menú", True, YELLOW)
-        menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, y_credits + 20))
-        screen.blit(menu_text, menu_rect)
+        lineas = [
+            (f"Llegaste hasta la escena {self.current_scene + 1}", WHITE, 130),
+            (f"Illas recuperadas: {len(self.player.articulos_collected)}/19", WHITE, 160),
+        ]
+        screen.blit(self.pantalla_final("GAME_OVER", lineas), (0, 0))
     
     def draw_victory(self, screen):
         """Dibuja la pantalla de victoria con créditos"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
-        
-        victory_text = self.font_big.render("¡VICTORIA TOTAL!", True, GREEN)
-        victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        screen.blit(victory_text, victory_rect)
-        
-        completion_text = self.font_medium.render("¡Ekeko completó su aventura por los 14 Apus!", True, WHITE)
-        completion_rect = completion_text.get_rect(center=(SCREEN_WIDTH // 2, 130))
-        screen.blit(completion_text, completion_rect)
-        
-        articles_text = self.font_medium.render(
-            f"Illas sagradas recuperadas: {len(self.player.articulos_collected)}/19", 
-            True, YELLOW
-        )
-        articles_rect = articles_text.get_rect(center=(SCREEN_WIDTH // 2, 160))
-        screen.blit(articles_text, articles_rect)
+        lineas = [
+            (f"Illas sagradas recuperadas: {len(self.player.articulos_collected)}/19", YELLOW, 160),
+        ]
+        screen.blit(self.pantalla_final("VICTORY", lineas), (0, 0))
+
+    def pantalla_final(self, estado, lineas):
+        """Retorna la pantalla final compuesta, rehecha solo si cambian sus números
+
+        - lineas: [(texto, color, y)] con los datos de la partida
+        - La parte fija (título, créditos, botón de menú) se compone una sola vez por estado
+        """
+        clave = (estado, tuple(lineas))
+        if self._clave_pantalla_final != clave:
+            if estado not in self._capas_finales:
+                self._capas_finales[estado] = self.crear_capa_final(estado)
+            pantalla = self._capas_finales[estado].copy()
+            for texto, color, y in lineas:
+                text_surface = render_text(self.font_medium, texto, color)
+                pantalla.blit(text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, y)))
+            self._pantalla_final = pantalla
+            self._clave_pantalla_final = clave
+        return self._pantalla_final
+
+    def crear_capa_final(self, estado):
+        """Compone la parte fija de la pantalla de game over o de victoria"""
+        # El fondo oscuro termina siendo negro: la capa al 200 se acumulaba frame a frame
+        capa = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        capa.fill(BLACK)
+        
+        if estado == "GAME_OVER":
+            title_text = self.font_big.render("¡GAME OVER!", True, RED)
+        else:
+            title_text = self.font_big.render("¡VICTORIA TOTAL!", True, GREEN)
+            completion_text = self.font_medium.render("¡Ekeko completó su aventura por los 14 Apus!", True, WHITE)
+            completion_rect = completion_text.get_rect(center=(SCREEN_WIDTH // 2, 130))
+            capa.blit(completion_text, completion_rect)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
+        capa.blit(title_text, title_rect)
         
         # Dibujar créditos
-        y_credits = self.draw_credits(screen, 220)
+        y_credits = self.draw_credits(capa, 220)
         
         # Botón de menú
         menu_text = self.font_medium.render("Presiona 'M' o ENTER para ir al menú", True, YELLOW)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, y_credits + 20))
-        screen.blit(menu_text, menu_rect)
+        capa.blit(menu_text, menu_rect)
+        return capa
+
+    def cerrar(self):
+        """Detiene los hilos de fondo: precarga y streaming de los biomas"""
+        self.precargador.cerrar()
+        self.fondos.cerrar()
+
     def run(self):
+        """Bucle principal: eventos, actualización y dibujo al ritmo de cada estado"""
         running = True
-        clock = pygame.time.Clock()
         while running:
-            for event in pygame.event.get():
+            estado = self.game_state
+            with traza.tramo("eventos", "frame", estado=estado):
+                eventos = self.planificador.eventos(estado)
+            for event in eventos:
                 if event.type == pygame.QUIT:
                     running = False
                 else:
@@ -1899,33 +2225,56 @@ class GameManager:
                     if result == "QUIT":
                         running = False
 
-            self.update()
-            self.draw(screen)
-            pygame.display.flip()
-            clock.tick(60)  # 60 FPS
-
+            # Simulación a paso fijo de 60 Hz, independiente del FPS de dibujo
+            pasos = self.planificador.pasos_simulacion()
+            with traza.tramo("update", "frame", pasos=pasos):
+                self.simular(pasos)
+            self.alpha_interpolacion = self.planificador.alpha
+            with traza.tramo("draw", "frame", estado=self.game_state):
+                self.render(screen)
+            with traza.tramo("espera", "frame"):
+                self.planificador.fin_de_frame(self.game_state)
+
+        print(f"⏱️ {self.planificador.resumen()}")
+        self.cerrar()
         pygame.quit()
         sys.exit()
+
 def main():
+    if "--traza" in sys.argv[1:]:
+        # python jugar.py --traza sesion.json: eventos para Perfetto / chrome://tracing
+        # Se inicia antes del GameManager para incluir las cargas del arranque
+        traza.iniciar(sys.argv[sys.argv.index("--traza") + 1])
     game = GameManager()
-    running = True
-    clock = pygame.time.Clock()
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            else:
-                result = game.handle_event(event)
-                if result == "QUIT":
-                    running = False
-
-        game.update()
-        game.draw(screen)
-        pygame.display.flip()
-        clock.tick(60)
-
-    pygame.quit()
-    sys.exit()
+    perfilador = None
+    if "--perfilar" in sys.argv[1:]:
+        # python jugar.py --perfilar [perfil.csv|perfil.json]: tiempos por subsistema (F3)
+        from perfilador import Perfilador
+        siguiente = sys.argv[sys.argv.index("--perfilar") + 1:][:1]
+        ruta_perfil = siguiente[0] if siguiente and not siguiente[0].startswith("--") else "perfil.csv"
+        perfilador = Perfilador()
+        # Antes del grabador: este guarda game.render y debe recibir la versión medida
+        perfilador.instrumentar(game)
+    grabador = None
+    if "--grabar" in sys.argv[1:]:
+        # python jugar.py --grabar partida.ekr: graba la entrada para repetirla luego
+        from grabacion import GrabadorEntrada
+        ruta = sys.argv[sys.argv.index("--grabar") + 1]
+        grabador = GrabadorEntrada()
+        grabador.conectar(game)
+    if "--precalentar" in sys.argv[1:]:
+        # python jugar.py --precalentar: decodifica todos los GIFs al inicio, en paralelo
+        import decodificacion
+        decodificacion.precalentar(game.recursos_del_juego())
+    try:
+        game.run()
+    finally:
+        if grabador:
+            grabador.guardar(ruta)
+        if perfilador:
+            perfilador.guardar(ruta_perfil)
+        if traza.activa:
+            traza.guardar()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
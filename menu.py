@@ -5,6 +5,11 @@
 import pygame
 import os
 
+from fuentes import fuente
+from instrucciones import LibroInstrucciones
+from recursos import load_gif_frames
+from textos import render_text, render_text_shadow
+
 # Colores del menú
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -12,24 +17,6 @@ YELLOW = (255, 255, 0)
 GREEN = (0, 100, 0)
 GRAY = (128, 128, 128)
 
-def load_gif_frames(gif_path):
-    """Carga todos los frames de un GIF como superficies pygame"""
-    try:
-        from PIL import Image
-        gif = Image.open(gif_path)
-        frames = []
-        for frame_num in range(gif.n_frames):
-            gif.seek(frame_num)
-            frame = gif.copy()
-            if frame.mode != "RGBA":
-                frame = frame.convert("RGBA")
-            frame_surface = pygame.image.fromstring(frame.tobytes(), frame.size, "RGBA")
-            frames.append(frame_surface)
-        return frames
-    except Exception as e:
-        print(f"Error cargando GIF {gif_path}: {e}")
-        return None
-
 def play_music(music_path, loop=-1):
     """Reproduce música de fondo"""
     try:
@@ -52,9 +39,12 @@ class MainMenu:
         self.SCREEN_HEIGHT = SCREEN_HEIGHT
         self.selected_option = 0
         self.options = ["JUGAR", "INSTRUCCIONES", "SALIR"]
-        self.font_title = pygame.font.SysFont("Arial", 48, bold=True)
-        self.font_subtitle = pygame.font.SysFont("Arial", 24, bold=True)
-        self.font_options = pygame.font.SysFont("Arial", 32, bold=True)
+        self.font_title = fuente("menu_titulo")
+        self.font_subtitle = fuente("menu_subtitulo")
+        self.font_options = fuente("menu_opciones")
+        self.font_ekeko = fuente("menu_ekeko")
+        self.font_nav = fuente("menu_nav")
+        self.font_info = fuente("menu_info")
         
         # 🎨 MEJORADO: Cargar fondo del menú con múltiples opciones
         self.background_frames = None
@@ -67,9 +57,8 @@ class MainMenu:
         
         for bg_path in self.background_gif_paths:
             if os.path.exists(bg_path):
-                self.background_frames = load_gif_frames(bg_path)
+                self.background_frames = load_gif_frames(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
                 if self.background_frames:
-                    self.background_frames = [pygame.transform.scale(f, (SCREEN_WIDTH, SCREEN_HEIGHT)) for f in self.background_frames]
                     self.current_frame = 0
                     self.animation_timer = 0
                     self.animation_speed = 0.1
@@ -85,11 +74,10 @@ class MainMenu:
         ekeko_paths = ["ekeko.gif", "mochila.gif"]
         for ekeko_path in ekeko_paths:
             if os.path.exists(ekeko_path):
-                self.ekeko_frames = load_gif_frames(ekeko_path)
+                # Redimensionar Ekeko para el menú
+                ekeko_size = 120
+                self.ekeko_frames = load_gif_frames(ekeko_path, (ekeko_size, ekeko_size))
                 if self.ekeko_frames:
-                    # Redimensionar Ekeko para el menú
-                    ekeko_size = 120
-                    self.ekeko_frames = [pygame.transform.scale(f, (ekeko_size, ekeko_size)) for f in self.ekeko_frames]
                     self.ekeko_current_frame = 0
                     self.ekeko_animation_timer = 0
                     self.ekeko_animation_speed = 0.15
@@ -186,24 +174,19 @@ class MainMenu:
             screen.blit(self.ekeko_frames[self.ekeko_current_frame], (ekeko_x, ekeko_y))
             
             # Texto "Ekeko" debajo del GIF
-            ekeko_text = pygame.font.SysFont("Arial", 16, bold=True).render("Ekeko", True, WHITE)
+            ekeko_text = render_text(self.font_ekeko, "Ekeko", WHITE)
             ekeko_text_rect = ekeko_text.get_rect(center=(ekeko_x + 60, ekeko_y + 130))
             screen.blit(ekeko_text, ekeko_text_rect)
         
         # Título principal con efecto de sombra mejorado
-        title_text = self.font_title.render("LA TRAVESÍA DE EKEKO", True, WHITE)
-        title_shadow = self.font_title.render("LA TRAVESÍA DE EKEKO", True, BLACK)
+        title_text = render_text_shadow(self.font_title, "LA TRAVESÍA DE EKEKO", WHITE, BLACK, (4, 4))
         title_rect = title_text.get_rect(center=(self.SCREEN_WIDTH // 2, 120))
-        shadow_rect = title_shadow.get_rect(center=(self.SCREEN_WIDTH // 2 + 4, 120 + 4))
-        screen.blit(title_shadow, shadow_rect)
         screen.blit(title_text, title_rect)
         
         # Subtítulo mejorado
-        subtitle_text = self.font_subtitle.render("Rescata las 19 Illas Sagradas de los 14 Apus", True, YELLOW)
-        subtitle_shadow = self.font_subtitle.render("Rescata las 19 Illas Sagradas de los 14 Apus", True, BLACK)
+        subtitle_text = render_text_shadow(self.font_subtitle, "Rescata las 19 Illas Sagradas de los 14 Apus",
+                                           YELLOW, BLACK, (2, 2))
         subtitle_rect = subtitle_text.get_rect(center=(self.SCREEN_WIDTH // 2, 170))
-        subtitle_shadow_rect = subtitle_shadow.get_rect(center=(self.SCREEN_WIDTH // 2 + 2, 170 + 2))
-        screen.blit(subtitle_shadow, subtitle_shadow_rect)
         screen.blit(subtitle_text, subtitle_rect)
         
         # Opciones del menú con diseño mejorado
@@ -221,25 +204,17 @@ class MainMenu:
                 color = WHITE
                 shadow_color = BLACK
             
-            text_surface = self.font_options.render(option, True, color)
-            shadow_surface = self.font_options.render(option, True, shadow_color)
-            
+            text_surface = render_text_shadow(self.font_options, option, color, shadow_color, (3, 3))
             text_rect = text_surface.get_rect(center=(self.SCREEN_WIDTH // 2, start_y + i * 60))
-            shadow_rect = shadow_surface.get_rect(center=(self.SCREEN_WIDTH // 2 + 3, start_y + i * 60 + 3))
-            
-            screen.blit(shadow_surface, shadow_rect)
             screen.blit(text_surface, text_rect)
         
         # Instrucciones de navegación mejoradas
-        nav_text = pygame.font.SysFont("Arial", 18).render("Usa ↑↓ para navegar, ENTER para seleccionar", True, WHITE)
-        nav_shadow = pygame.font.SysFont("Arial", 18).render("Usa ↑↓ para navegar, ENTER para seleccionar", True, BLACK)
+        nav_text = render_text_shadow(self.font_nav, "Usa ↑↓ para navegar, ENTER para seleccionar", WHITE, BLACK, (1, 1))
         nav_rect = nav_text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT - 80))
-        nav_shadow_rect = nav_shadow.get_rect(center=(self.SCREEN_WIDTH // 2 + 1, self.SCREEN_HEIGHT - 79))
-        screen.blit(nav_shadow, nav_shadow_rect)
         screen.blit(nav_text, nav_rect)
         
         # Información adicional
-        info_text = pygame.font.SysFont("Arial", 14).render("Presiona ESC para salir del juego", True, GRAY)
+        info_text = render_text(self.font_info, "Presiona ESC para salir del juego", GRAY)
         info_rect = info_text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT - 40))
         screen.blit(info_text, info_rect)
 
@@ -247,16 +222,20 @@ class InstructionsScreen:
     def __init__(self, SCREEN_WIDTH, SCREEN_HEIGHT):
         self.SCREEN_WIDTH = SCREEN_WIDTH
         self.SCREEN_HEIGHT = SCREEN_HEIGHT
-        self.font_title = pygame.font.SysFont("Arial", 36, bold=True)
-        self.font_text = pygame.font.SysFont("Arial", 18)
+        self.font_title = fuente("instrucciones_titulo")
+        self.font_text = fuente("instrucciones_texto")
+        # Libro compuesto una sola vez (ver instrucciones.LibroInstrucciones)
+        self.libro = LibroInstrucciones()
         
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE or event.key == pygame.K_RETURN:
                 return "BACK"
+            elif event.key == pygame.K_LEFT:  # 🎮 PÁGINA ANTERIOR
+                self.libro.pasar_pagina(-1)
+            elif event.key == pygame.K_RIGHT:  # 🎮 PÁGINA SIGUIENTE
+                self.libro.pasar_pagina(1)
         return None
     
     def draw(self, screen):
-        # Importar función de instrucciones
-        from instrucciones import dibujar_instrucciones
-        dibujar_instrucciones(screen, self.font_title, self.font_text, self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        self.libro.dibujar(screen, self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
@@ -0,0 +1,217 @@
+# ================== PERFILADOR DE FRAMES ==================
+# Archivo separado con la medición de tiempos por subsistema
+# Mide cuánto tarda cada fase de update y draw por tipo de objeto (fondo, Ekeko,
+# Apu, portal, illas, textos...) y muestra p50/p95/p99 de los últimos frames
+#
+# Es opcional: sin instrumentar() no se toca ninguna clase y no cuesta nada
+#
+# USO: python jugar.py --perfilar               (F3 muestra/oculta el panel,
+#      python jugar.py --perfilar perfil.json    al salir se guarda perfil.csv
+#                                                o el archivo indicado, .csv o .json)
+
+import csv
+import json
+import sys
+import time
+from collections import deque
+
+import pygame
+
+from fuentes import fuente
+from planificador import percentil
+from renderizado import capa_translucida
+
+# Frames usados para los percentiles
+VENTANA_FRAMES = 300
+# Frames guardados para la traza del archivo de salida (10 minutos a 60 FPS)
+MAX_FRAMES_TRAZA = 36000
+# El panel se rehace cada tantos frames (los números cambian en cada frame)
+FRAMES_POR_PANEL = 30
+# Filas del panel (las fases con mayor p95)
+FILAS_PANEL = 14
+TECLA_PANEL = pygame.K_F3
+
+
+def fases_del_juego(jugar, menu):
+    """(fase, clase, método) que se miden; los tiempos son inclusivos
+
+    GameScene.draw incluye a las illas, el Apu y el portal; "render" es el frame entero.
+    """
+    return [
+        ("update", jugar.GameManager, "update"),
+        ("update/GameScene", jugar.GameScene, "update"),
+        ("update/Player", jugar.Player, "update"),
+        ("update/Apu", jugar.Apu, "update"),
+        ("update/Portal", jugar.Portal, "update"),
+        ("update/Articulo", jugar.Articulo, "update"),
+        ("update/AnimatedBackground", jugar.AnimatedBackground, "update"),
+        ("update/MainMenu", menu.MainMenu, "update"),
+        ("render", jugar.GameManager, "render"),
+        ("draw", jugar.GameManager, "draw"),
+        ("draw/capa_juego", jugar.GameManager, "draw_playing_layer"),
+        ("draw/AnimatedBackground", jugar.AnimatedBackground, "draw"),
+        ("draw/GameScene", jugar.GameScene, "draw"),
+        ("draw/Player", jugar.Player, "draw"),
+        ("draw/Apu", jugar.Apu, "draw"),
+        ("draw/Portal", jugar.Portal, "draw"),
+        ("draw/Articulo", jugar.Articulo, "draw"),
+        ("draw/MochilaVisual", jugar.MochilaVisual, "draw"),
+        ("draw/QuestionScreen", jugar.QuestionScreen, "draw"),
+        ("draw/MainMenu", menu.MainMenu, "draw"),
+        ("draw/InstructionsScreen", menu.InstructionsScreen, "draw"),
+        # Los textos se importan por nombre: se reemplazan en cada módulo que los usa
+        ("draw/textos", jugar, "render_text"),
+        ("draw/textos", jugar, "render_text_shadow"),
+        ("draw/textos", menu, "render_text"),
+        ("draw/textos", menu, "render_text_shadow"),
+    ]
+
+
+class Perfilador:
+    """Tiempos por fase y por frame, con percentiles móviles
+
+    FUNCIONAMIENTO:
+    - instrumentar(game) envuelve los métodos de fases_del_juego en sus clases
+    - Cada llamada suma su duración a la fase del frame actual (varias illas = una fase)
+    - Al terminar GameManager.render se cierra el frame: cada fase que corrió
+      guarda su total en una ventana de VENTANA_FRAMES frames
+    """
+    def __init__(self):
+        self.ventanas = {}       # fase -> deque de ms por frame
+        self.traza = deque(maxlen=MAX_FRAMES_TRAZA)  # (frame, {fase: ms})
+        self.frame = 0
+        self.mostrar_panel = False
+        self._actual = {}
+        self._panel = None
+        self._panel_frame = -FRAMES_POR_PANEL
+
+    # ---------- Instrumentación ----------
+    def _envolver(self, fase, funcion):
+        actual = self._actual
+
+        def envoltura(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                actual[fase] = actual.get(fase, 0.0) + (time.perf_counter() - inicio) * 1000
+        envoltura.__wrapped__ = funcion
+        return envoltura
+
+    def instrumentar(self, game):
+        """Empieza a medir: envuelve las fases del juego y conecta el panel a `game`"""
+        # El juego corre como __main__: "import jugar" cargaría una segunda copia
+        # (otra pantalla, otras clases) y se medirían clases que nadie usa
+        jugar = sys.modules[type(game).__module__]
+        import menu
+        fases = fases_del_juego(jugar, menu)
+        for fase, objeto, nombre in fases:
+            setattr(objeto, nombre, self._envolver(fase, getattr(objeto, nombre)))
+
+        # Frame cerrado al terminar cada render
+        render = game.render
+
+        def render_midiendo(screen):
+            render(screen)
+            self.cerrar_frame()
+        game.render = render_midiendo
+
+        # El panel se dibuja al final de draw (con el panel visible no hay rectángulos sucios)
+        draw = game.draw
+
+        def draw_con_panel(screen):
+            draw(screen)
+            if self.mostrar_panel:
+                self.dibujar_panel(screen)
+        game.draw = draw_con_panel
+
+        handle_event = game.handle_event
+
+        def handle_event_con_panel(event):
+            if event.type == pygame.KEYDOWN and event.key == TECLA_PANEL:
+                self.mostrar_panel = not self.mostrar_panel
+                game.rectangulos_sucios = not self.mostrar_panel
+                return "CONTINUE"
+            return handle_event(event)
+        game.handle_event = handle_event_con_panel
+        print(f"📊 Perfilador activo ({len(fases)} fases, F3 muestra el panel)")
+
+    # ---------- Mediciones ----------
+    def cerrar_frame(self):
+        """Pasa los tiempos del frame actual a las ventanas de percentiles"""
+        if self._actual:
+            for fase, ms in self._actual.items():
+                ventana = self.ventanas.get(fase)
+                if ventana is None:
+                    ventana = self.ventanas[fase] = deque(maxlen=VENTANA_FRAMES)
+                ventana.append(ms)
+            self.traza.append((self.frame, dict(self._actual)))
+            self._actual.clear()
+        self.frame += 1
+
+    def resumen(self):
+        """{fase: {n, p50, p95, p99, media, max}} en milisegundos sobre la ventana"""
+        datos = {}
+        for fase, ventana in self.ventanas.items():
+            ordenados = sorted(ventana)
+            datos[fase] = {
+                "n": len(ordenados),
+                "p50": percentil(ordenados, 50),
+                "p95": percentil(ordenados, 95),
+                "p99": percentil(ordenados, 99),
+                "media": sum(ordenados) / len(ordenados),
+                "max": ordenados[-1],
+            }
+        return datos
+
+    # ---------- Panel en pantalla ----------
+    def dibujar_panel(self, screen):
+        """Dibuja la tabla de percentiles (rehecha cada FRAMES_POR_PANEL frames)"""
+        if self._panel is None or self.frame - self._panel_frame >= FRAMES_POR_PANEL:
+            self._panel = self._crear_panel()
+            self._panel_frame = self.frame
+        posicion = (screen.get_width() - self._panel.get_width() - 10, 40)  # Bajo el progreso
+        screen.blit(capa_translucida(self._panel.get_size(), 190), posicion)
+        screen.blit(self._panel, posicion)
+
+    def _crear_panel(self):
+        """Superficie con la tabla: fase y p50/p95/p99 en columnas alineadas a la derecha"""
+        font = fuente("perfil")
+        filas = sorted(self.resumen().items(), key=lambda item: item[1]["p95"], reverse=True)
+        tabla = [["fase (ms)", "p50", "p95", "p99"]]
+        for fase, datos in filas[:FILAS_PANEL]:
+            tabla.append([fase] + [f"{datos[nivel]:.2f}" for nivel in ("p50", "p95", "p99")])
+        celdas = [[font.render(texto, True, (255, 255, 255)) for texto in fila] for fila in tabla]
+        anchos = [max(fila[c].get_width() for fila in celdas) for c in range(4)]
+        separacion = 12
+        alto_linea = font.get_linesize()
+        panel = pygame.Surface((sum(anchos) + 3 * separacion + 16, alto_linea * len(celdas) + 12),
+                               pygame.SRCALPHA)
+        for i, fila in enumerate(celdas):
+            y = 6 + i * alto_linea
+            panel.blit(fila[0], (8, y))
+            x = 8 + anchos[0]
+            for c in range(1, 4):
+                x += separacion + anchos[c]
+                panel.blit(fila[c], (x - fila[c].get_width(), y))
+        return panel
+
+    # ---------- Archivo de salida ----------
+    def guardar(self, ruta):
+        """Guarda el resumen y la traza por frame en CSV o JSON (según la extensión)"""
+        fases = sorted({fase for _, tiempos in self.traza for fase in tiempos})
+        if ruta.lower().endswith(".json"):
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump({
+                    "ventana_frames": VENTANA_FRAMES,
+                    "resumen": self.resumen(),
+                    "frames": [{"frame": frame, **tiempos} for frame, tiempos in self.traza],
+                }, archivo, indent=1)
+        else:
+            with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+                escritor = csv.writer(archivo)
+                escritor.writerow(["frame"] + fases)
+                for frame, tiempos in self.traza:
+                    escritor.writerow([frame] + [f"{tiempos[fase]:.4f}" if fase in tiempos else ""
+                                                 for fase in fases])
+        print(f"📊 Perfil guardado: {ruta} ({len(self.traza)} frames, {len(fases)} fases)")
@@ -0,0 +1,117 @@
+# ================== PLANIFICADOR DE FRAMES ==================
+# Archivo separado con el ritmo del bucle principal
+# Cada estado del juego tiene su propio FPS: jugar necesita 60, el menú 30
+# y las pantallas estáticas solo se redibujan cuando llega un evento
+
+import math
+import time
+from collections import deque
+
+import pygame
+
+# Frames recientes usados para el FPS y los percentiles
+MUESTRAS_FRAMES = 240
+
+# Simulación a paso fijo: cada update() del juego avanza exactamente 1/60 s
+PASO_SIMULACION = 1 / 60
+# Tiempo máximo acumulado: tras una pausa larga no se simulan cientos de pasos seguidos
+MAX_ACUMULADO = 0.25
+
+
+def percentil(ordenados, nivel):
+    """Percentil `nivel` (0-100) de una lista ya ordenada, por rango más cercano
+
+    Es el menor valor que deja al menos `nivel` % de las muestras a su izquierda
+    (incluido él mismo).
+    """
+    rango = math.ceil(nivel * len(ordenados) / 100)
+    return ordenados[max(0, rango - 1)]
+
+
+class PlanificadorFrames:
+    """Elige el ritmo del bucle según el estado y mide los tiempos de frame
+
+    RITMOS POR ESTADO (fps_por_estado):
+    - Un número: el bucle se limita a ese FPS con Clock.tick
+    - None: el bucle duerme en pygame.event.wait hasta que llega un evento
+      (o hasta espera_maxima_ms, para que la pantalla se siga redibujando)
+    - Estados que no están en el diccionario usan fps_defecto
+
+    PASO FIJO (pasos_simulacion):
+    - El tiempo real transcurrido se suma a un acumulador
+    - Se simulan tantos pasos de PASO_SIMULACION como quepan en el acumulador
+    - Lo que sobra queda en `alpha` (0 a 1) para dibujar interpolando posiciones
+    """
+    def __init__(self, fps_por_estado, fps_defecto=60, espera_maxima_ms=500):
+        self.fps_por_estado = fps_por_estado
+        self.fps_defecto = fps_defecto
+        self.espera_maxima_ms = espera_maxima_ms
+        self.clock = pygame.time.Clock()
+        self.tiempos_frame = deque(maxlen=MUESTRAS_FRAMES)  # Milisegundos por frame
+        self._inicio_frame = None
+        self.acumulado = 0.0
+        self.alpha = 1.0  # Fracción del siguiente paso ya transcurrida
+        self._ultimo_paso = None
+
+    def fps_de(self, estado):
+        """FPS objetivo de un estado (None = esperar eventos)"""
+        return self.fps_por_estado.get(estado, self.fps_defecto)
+
+    def pasos_simulacion(self):
+        """Cuántos pasos fijos hay que simular en este frame (actualiza `alpha`)"""
+        ahora = time.perf_counter()
+        if self._ultimo_paso is None:
+            # Primer frame: un paso, sin historia que interpolar
+            self._ultimo_paso = ahora
+            self.alpha = 1.0
+            return 1
+        self.acumulado = min(self.acumulado + ahora - self._ultimo_paso, MAX_ACUMULADO)
+        self._ultimo_paso = ahora
+        pasos = int(self.acumulado / PASO_SIMULACION)
+        self.acumulado -= pasos * PASO_SIMULACION
+        self.alpha = self.acumulado / PASO_SIMULACION
+        return pasos
+
+    def eventos(self, estado):
+        """Eventos del frame; en los estados por eventos espera el primero"""
+        if self.fps_de(estado) is None:
+            evento = pygame.event.wait(self.espera_maxima_ms)
+            eventos = [] if evento.type == pygame.NOEVENT else [evento]
+            eventos.extend(pygame.event.get())
+            return eventos
+        return pygame.event.get()
+
+    def fin_de_frame(self, estado):
+        """Limita el FPS del estado y registra cuánto duró el frame"""
+        fps = self.fps_de(estado)
+        self.clock.tick(fps or 0)
+        ahora = time.perf_counter()
+        if self._inicio_frame is not None:
+            self.tiempos_frame.append((ahora - self._inicio_frame) * 1000)
+        self._inicio_frame = ahora
+
+    def fps(self):
+        """FPS logrado en los frames recientes"""
+        if not self.tiempos_frame:
+            return 0.0
+        return 1000 * len(self.tiempos_frame) / sum(self.tiempos_frame)
+
+    def percentiles(self, niveles=(50, 95, 99)):
+        """Percentiles del tiempo de frame en milisegundos: {50: ..., 95: ..., 99: ...}"""
+        if not self.tiempos_frame:
+            return {nivel: 0.0 for nivel in niveles}
+        ordenados = sorted(self.tiempos_frame)
+        return {nivel: percentil(ordenados, nivel) for nivel in niveles}
+
+    def reiniciar(self):
+        """Descarta las mediciones y el tiempo acumulado"""
+        self.tiempos_frame.clear()
+        self._inicio_frame = None
+        self.acumulado = 0.0
+        self.alpha = 1.0
+        self._ultimo_paso = None
+
+    def resumen(self):
+        """Texto corto con el FPS y los percentiles del tiempo de frame"""
+        p = self.percentiles()
+        return f"{self.fps():.1f} FPS | frame p50 {p[50]:.1f} ms, p95 {p[95]:.1f} ms, p99 {p[99]:.1f} ms"
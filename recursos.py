@@ -0,0 +1,592 @@
+# ================== CACHÉ DE RECURSOS ==================
+# Archivo separado con la carga de GIFs compartida por jugar.py y menu.py
+# Cada GIF se decodifica y escala una sola vez por proceso
+
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from PIL import Image
+
+import atlas
+import traza
+
+# Presupuesto de memoria del caché (bytes de píxeles decodificados)
+PRESUPUESTO_CACHE_BYTES = 256 * 1024 * 1024
+
+# Rotaciones precalculadas: grados por cubeta (coincide con Articulo.rotation_speed)
+PASO_ROTACION = 2
+PRESUPUESTO_ROTACIONES_BYTES = 96 * 1024 * 1024
+
+# Filtro con el que PIL reduce o amplía los frames antes de crear las superficies
+# (NEAREST conserva el aspecto pixelado; BOX o LANCZOS suavizan las reducciones)
+FILTRO_ESCALADO = Image.Resampling.NEAREST
+
+# False repite el camino anterior: copiar cada frame a pygame en su tamaño
+# original y escalarlo ahí (solo para comparar, ver benchmarks/bytes_escalado.py)
+ESCALAR_EN_PIL = True
+
+# Frames decodificados por adelantado en la reproducción en streaming
+FRAMES_EN_ANILLO = 6
+# Segundos que se espera el primer frame de un GIF en streaming
+ESPERA_PRIMER_FRAME = 5.0
+
+
+class CacheFrames:
+    """Caché LRU de frames decodificados, limitado por bytes
+
+    CLAVE: (ruta normalizada, tamaño destino, volteado, paleta, filtro)
+    - Al consultar: la entrada pasa al final (usada recientemente)
+    - Al guardar: se descartan las entradas más antiguas hasta respetar el presupuesto
+    """
+    def __init__(self, presupuesto_bytes):
+        self.presupuesto_bytes = presupuesto_bytes
+        self.bytes_usados = 0
+        self._entradas = OrderedDict()  # clave -> (frames, bytes)
+
+    def obtener(self, clave):
+        """Retorna los frames guardados o None si no están en caché"""
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            return None
+        self._entradas.move_to_end(clave)
+        return entrada[0]
+
+    def guardar(self, clave, frames):
+        """Guarda los frames y descarta los menos usados si se supera el presupuesto"""
+        self.descartar(clave)
+        tamano = bytes_de_frames(frames)
+        self._entradas[clave] = (frames, tamano)
+        self.bytes_usados += tamano
+        # Nunca se descarta la entrada recién guardada
+        while self.bytes_usados > self.presupuesto_bytes and len(self._entradas) > 1:
+            _, (_, tamano_viejo) = self._entradas.popitem(last=False)
+            self.bytes_usados -= tamano_viejo
+
+    def descartar(self, clave):
+        """Elimina una entrada del caché si existe"""
+        entrada = self._entradas.pop(clave, None)
+        if entrada is not None:
+            self.bytes_usados -= entrada[1]
+
+    def limpiar(self):
+        """Vacía el caché por completo"""
+        self._entradas.clear()
+        self.bytes_usados = 0
+
+    def items(self):
+        """Retorna una copia de las entradas (clave, frames) sin alterar el orden LRU"""
+        return [(clave, frames) for clave, (frames, _) in self._entradas.items()]
+
+    def __contains__(self, clave):
+        return clave in self._entradas
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+# Caché único del proceso
+cache_frames = CacheFrames(PRESUPUESTO_CACHE_BYTES)
+# Frames rotados: (clave del GIF, índice de frame, cubeta de ángulo) -> [superficie]
+cache_rotaciones = CacheFrames(PRESUPUESTO_ROTACIONES_BYTES)
+
+
+def bytes_de_frames(frames):
+    """Calcula los bytes de píxeles que ocupan una lista de superficies"""
+    return sum(f.get_pitch() * f.get_height() for f in frames)
+
+
+def clave_cache(gif_path, size=None, flip=False, paleta=False, filtro=None):
+    """Construye la clave del caché para un GIF (paleta: frames de 8 bits)"""
+    filtro = FILTRO_ESCALADO if filtro is None else filtro
+    return (os.path.normpath(gif_path), tuple(size) if size else None, bool(flip), bool(paleta),
+            int(filtro))
+
+
+def gif_size(gif_path):
+    """Retorna el tamaño original (ancho, alto) de un GIF sin decodificar sus frames"""
+    try:
+        with Image.open(gif_path) as gif:
+            return gif.size
+    except Exception as e:
+        print(f"Error leyendo GIF {gif_path}: {e}")
+        return None
+
+
+def scaled_size(gif_path, scale_factor):
+    """Retorna el tamaño de un GIF multiplicado por un factor de escala"""
+    size = gif_size(gif_path)
+    if size is None:
+        return None
+    return (int(size[0] * scale_factor), int(size[1] * scale_factor))
+
+
+def _decodificar_gif(gif_path, size=None, filtro=None):
+    """Decodifica todos los frames de un GIF como superficies pygame RGBA
+
+    - size: tamaño final; PIL escala cada frame antes de crear la superficie
+    Retorna (frames, opaco): opaco es True si ningún píxel tiene transparencia.
+    """
+    with Image.open(gif_path) as gif:
+        frames = []
+        opaco = True
+        for frame_num in range(gif.n_frames):
+            gif.seek(frame_num)
+            frame_surface, frame_opaco = _superficie_de_frame(gif, size, filtro)
+            opaco = opaco and frame_opaco
+            frames.append(frame_surface)
+    return frames, opaco
+
+
+def _superficie_de_frame(gif, size=None, filtro=None):
+    """Convierte el frame actual de un GIF abierto en (superficie RGBA, opaco)"""
+    frame = gif.copy()
+    if frame.mode != "RGBA":
+        frame = frame.convert("RGBA")
+    # Alfa mínimo del frame (se revisa en PIL, antes de escalar)
+    opaco = frame.getextrema()[3][0] == 255
+    return _a_superficie(frame, "RGBA", size, filtro), opaco
+
+
+# Bytes de píxeles que pasan de PIL a pygame (tobytes + fromstring) y bytes de
+# las superficies que escala pygame, acumulados desde reiniciar_bytes_copiados()
+bytes_copiados = {"pil_a_pygame": 0, "escalado_pygame": 0}
+
+
+def reiniciar_bytes_copiados():
+    """Pone en cero los contadores de bytes_copiados"""
+    for contador in bytes_copiados:
+        bytes_copiados[contador] = 0
+
+
+def _a_superficie(imagen, formato, size=None, filtro=None):
+    """Crea la superficie pygame de una imagen PIL, ya en el tamaño final
+
+    Las reducciones se hacen en PIL, así que a pygame solo se copian los píxeles
+    que quedan. Las ampliaciones por vecino más cercano se dejan para
+    pygame.transform.scale, que es varias veces más rápido y copia menos bytes.
+    """
+    filtro = FILTRO_ESCALADO if filtro is None else filtro
+    if ESCALAR_EN_PIL and size and imagen.size != tuple(size):
+        reduce = size[0] * size[1] < imagen.width * imagen.height
+        if reduce or filtro != Image.Resampling.NEAREST:
+            imagen = imagen.resize(size, filtro)
+    datos = imagen.tobytes()
+    bytes_copiados["pil_a_pygame"] += len(datos)
+    superficie = pygame.image.fromstring(datos, imagen.size, formato)
+    if size and superficie.get_size() != tuple(size):
+        superficie = pygame.transform.scale(superficie, size)
+        bytes_copiados["escalado_pygame"] += superficie.get_pitch() * superficie.get_height()
+    return superficie
+
+
+# ================== FRAMES CON PALETA (8 BITS) ==================
+# Los GIFs tienen como mucho 256 colores: guardar sus frames como superficies de
+# 8 bits con la paleta del GIF ocupa la cuarta parte que en RGBA. Los índices se
+# escalan siempre por vecino más cercano (cualquier otro filtro mezclaría índices),
+# así que no aparecen colores nuevos. Solo para GIFs opacos (los fondos de bioma).
+
+class PaletaGif:
+    """Paleta del primer frame de un GIF, compartida por todos sus frames"""
+    def __init__(self, gif):
+        gif.seek(0)
+        valores = gif.getpalette() or []
+        self.valores = valores
+        self.colores = [tuple(valores[i:i + 3]) for i in range(0, len(valores), 3)]
+        self._indices = {}  # color -> índice en la paleta
+        for indice, color in enumerate(self.colores):
+            self._indices.setdefault(color, indice)
+
+    def indice_de(self, color):
+        """Índice del color en la paleta (o del más cercano si no está)"""
+        indice = self._indices.get(color)
+        if indice is None:
+            indice = min(range(len(self.colores)),
+                         key=lambda i: sum((a - b) ** 2 for a, b in zip(self.colores[i], color)))
+            self._indices[color] = indice
+        return indice
+
+
+def _superficie_paleta(gif, paleta, size=None):
+    """Frame actual de un GIF abierto como superficie de 8 bits (None si tiene transparencia)
+
+    El primer frame ya usa la paleta compartida. PIL entrega en RGBA los que
+    siguen: con 256 colores o menos, la paleta adaptativa de PIL conserva los
+    colores exactos y cada uno de sus índices se traduce al del mismo color en
+    la paleta compartida.
+    """
+    frame = gif.convert("RGBA")
+    if frame.getextrema()[3][0] != 255:
+        return None
+    if gif.mode == "P" and gif.getpalette() == paleta.valores:
+        indices = gif
+    else:
+        propio = frame.convert("RGB").convert("P", palette=Image.ADAPTIVE, colors=256)
+        valores = propio.getpalette()
+        tabla = [paleta.indice_de(tuple(valores[i:i + 3])) for i in range(0, len(valores), 3)]
+        tabla += [0] * (256 - len(tabla))
+        indices = Image.frombytes("L", propio.size, propio.tobytes()).point(tabla)
+    superficie = _a_superficie(indices, "P", size, Image.Resampling.NEAREST)
+    superficie.set_palette(paleta.colores)
+    return superficie
+
+
+def _cargar_frames_paleta(gif_path, size=None):
+    """Decodifica y escala un GIF a frames de 8 bits (usable desde otros hilos)
+
+    Retorna None si algún frame tiene transparencia (hay que usar RGBA).
+    """
+    with Image.open(gif_path) as gif:
+        paleta = PaletaGif(gif)
+        frames = []
+        for frame_num in range(gif.n_frames):
+            gif.seek(frame_num)
+            frame_surface = _superficie_paleta(gif, paleta, size)
+            if frame_surface is None:
+                return None
+            frames.append(frame_surface)
+    return frames
+
+
+def _cargar_frames(gif_path, size=None, usar_atlas=True, filtro=None):
+    """Decodifica y escala un GIF sin pasar por el caché (usable desde otros hilos)
+
+    Si existe un atlas horneado y vigente (ver atlas.py) se usa en lugar del GIF;
+    los atlas se hornean con FILTRO_ESCALADO, así que otro filtro va siempre al GIF.
+    Retorna (frames, opaco).
+    """
+    if usar_atlas and (filtro is None or filtro == FILTRO_ESCALADO):
+        cargado = atlas.cargar_atlas(gif_path, size)
+        if cargado is not None:
+            return cargado
+    return _decodificar_gif(gif_path, size, filtro)
+
+
+# ================== FORMATO DE PANTALLA ==================
+# Los frames se convierten al formato de la pantalla para que cada blit
+# no tenga que convertir píxel por píxel:
+# - convert(): frames totalmente opacos (fondos de bioma a pantalla completa)
+# - convert_alpha(): sprites con transparencia (Apus, illas, Ekeko)
+
+def es_formato_pantalla(surface):
+    """True si la superficie ya tiene el formato de píxel de la pantalla"""
+    pantalla = pygame.display.get_surface()
+    if pantalla is None:
+        return False
+    return (surface.get_bitsize() == pantalla.get_bitsize()
+            and surface.get_masks()[:3] == pantalla.get_masks()[:3])
+
+
+def _es_opaco(frame):
+    """True si todos los píxeles del frame tienen alfa completo (revisión lenta)"""
+    if not frame.get_flags() & pygame.SRCALPHA:
+        return True
+    ancho, alto = frame.get_size()
+    return pygame.mask.from_surface(frame, 254).count() == ancho * alto
+
+
+def a_formato_pantalla(frames, opaco=None):
+    """Convierte los frames al formato de la pantalla (solo desde el hilo principal)
+
+    - opaco: resultado de la decodificación; None para revisar cada frame
+    Si todavía no hay pantalla se retornan sin convertir; convertir_pendientes()
+    los convierte más tarde.
+    """
+    if pygame.display.get_surface() is None:
+        return frames
+    convertidos = []
+    for frame in frames:
+        if es_formato_pantalla(frame):
+            convertidos.append(frame)
+        elif opaco if opaco is not None else _es_opaco(frame):
+            convertidos.append(frame.convert())
+        else:
+            convertidos.append(frame.convert_alpha())
+    return convertidos
+
+
+def convertir_pendientes():
+    """Convierte las entradas del caché cargadas antes de crear la pantalla
+
+    Las entradas con paleta se quedan en 8 bits a propósito.
+    """
+    for clave, frames in cache_frames.items():
+        if not clave[3] and not all(es_formato_pantalla(f) for f in frames):
+            cache_frames.guardar(clave, a_formato_pantalla(frames))
+
+
+def verificar_formato_pantalla():
+    """Autoverificación: informa qué recursos del caché quedaron sin convertir"""
+    sin_convertir = [clave for clave, frames in cache_frames.items()
+                     if not clave[3] and not all(es_formato_pantalla(f) for f in frames)]
+    if sin_convertir:
+        print(f"⚠️ {len(sin_convertir)} recursos sin convertir al formato de pantalla:")
+        for ruta, size, flip, *_ in sin_convertir:
+            print(f"   - {ruta} {size or 'original'}{' (volteado)' if flip else ''}")
+    else:
+        print(f"✅ {len(cache_frames)} recursos en formato de pantalla")
+    return sin_convertir
+
+
+def load_gif_frames(gif_path, size=None, flip=False, paleta=False, filtro=None):
+    """Carga todos los frames de un GIF como superficies pygame
+
+    - size: (ancho, alto) al que se escalan los frames (None = tamaño original)
+    - flip: True para voltear horizontalmente los frames
+    - paleta: True para frames de 8 bits con la paleta del GIF (si el GIF tiene
+      transparencia se cargan en RGBA)
+    - filtro: filtro de PIL para escalar (None = FILTRO_ESCALADO; con paleta
+      siempre es vecino más cercano)
+    Los frames se guardan en el caché compartido y no deben modificarse.
+    """
+    with traza.tramo("load_gif_frames", "carga", gif=gif_path, size=size, flip=flip, paleta=paleta):
+        return _load_gif_frames(gif_path, size, flip, paleta, filtro)
+
+
+def _load_gif_frames(gif_path, size, flip, paleta=False, filtro=None):
+    clave = clave_cache(gif_path, size, flip, paleta, filtro)
+    frames = cache_frames.obtener(clave)
+    if frames is not None:
+        return list(frames)
+
+    if flip:
+        # El volteado se construye a partir de la versión normal (también en caché)
+        frames = load_gif_frames(gif_path, size, paleta=paleta, filtro=filtro)
+        if frames is None:
+            return None
+        frames = [pygame.transform.flip(f, True, False) for f in frames]
+    elif paleta:
+        try:
+            frames = _cargar_frames_paleta(gif_path, size)
+        except Exception as e:
+            print(f"Error cargando GIF {gif_path}: {e}")
+            return None
+        if frames is None:
+            print(f"⚠️ {gif_path} tiene transparencia: se carga en RGBA")
+            return load_gif_frames(gif_path, size, flip, filtro=filtro)
+    else:
+        try:
+            frames, opaco = _cargar_frames(gif_path, size, filtro=filtro)
+        except Exception as e:
+            print(f"Error cargando GIF {gif_path}: {e}")
+            return None
+        frames = a_formato_pantalla(frames, opaco)
+
+    cache_frames.guardar(clave, frames)
+    return list(frames)
+
+
+def descartar_gif(gif_path, size=None):
+    """Saca del caché todas las variantes (volteado, paleta, filtro) de un GIF a un tamaño"""
+    ruta_y_tamano = clave_cache(gif_path, size)[:2]
+    for clave, _ in cache_frames.items():
+        if clave[:2] == ruta_y_tamano:
+            cache_frames.descartar(clave)
+
+
+def rotated_frame(gif_path, size, frame_index, angle, paso=PASO_ROTACION):
+    """Retorna un frame del GIF rotado, compartido por todos los que usan el mismo GIF
+
+    El ángulo se redondea a cubetas de `paso` grados; cada (frame, cubeta) se
+    rota una sola vez y luego es solo una búsqueda en el caché.
+    """
+    cubeta = int(angle // paso) % (360 // paso)
+    clave = (clave_cache(gif_path, size), frame_index, cubeta)
+    rotado = cache_rotaciones.obtener(clave)
+    if rotado is None:
+        frames = load_gif_frames(gif_path, size)
+        if not frames:
+            return None
+        rotado = [pygame.transform.rotate(frames[frame_index], cubeta * paso)]
+        cache_rotaciones.guardar(clave, rotado)
+    return rotado[0]
+
+
+# ================== REPRODUCCIÓN EN STREAMING ==================
+
+class GifEnStreaming:
+    """Reproduce un GIF en bucle con solo unos pocos frames decodificados a la vez
+
+    FUNCIONAMIENTO DEL ANILLO:
+    - Un hilo abre el GIF con PIL y lo recorre en bucle (al terminar vuelve al frame 0)
+    - Cada frame se pasa a RGBA y se escala en el hilo, y queda en una cola de
+      `capacidad` frames; con la cola llena el hilo espera a que se consuma
+    - siguiente(): desde el bucle principal, toma el próximo frame y lo convierte
+      al formato de la pantalla
+    - En memoria hay como mucho capacidad + 2 frames (la cola, el que se muestra
+      y el que el hilo está decodificando), sin importar cuántos frames tenga el GIF
+    - paleta: frames de 8 bits (ver FRAMES CON PALETA); un frame con transparencia
+      se entrega en RGBA
+    - filtro: filtro de PIL para escalar los frames RGBA (None = FILTRO_ESCALADO)
+    Los frames no pasan por el caché compartido.
+    """
+    def __init__(self, gif_path, size=None, capacidad=FRAMES_EN_ANILLO, paleta=False, filtro=None):
+        self.gif_path = gif_path
+        self.size = tuple(size) if size else None
+        self.capacidad = capacidad
+        self.paleta = paleta
+        self.filtro = filtro
+        self.frame_actual = None
+        self.indice = -1
+        self.atrasos = 0  # Veces que el hilo no tenía listo el siguiente frame
+        self._cola = queue.Queue(maxsize=capacidad)
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._decodificar, daemon=True,
+                                      name=f"streaming_{os.path.basename(gif_path)}")
+        self._hilo.start()
+
+    def _decodificar(self):
+        """Se ejecuta en el hilo de streaming: decodifica en bucle hasta cerrar()"""
+        try:
+            with Image.open(self.gif_path) as gif:
+                total = getattr(gif, "n_frames", 1)
+                paleta = PaletaGif(gif) if self.paleta else None
+                indice = 0
+                while not self._detener.is_set():
+                    with traza.tramo("decodificar_frame", "carga", gif=self.gif_path, frame=indice):
+                        gif.seek(indice)
+                        superficie = _superficie_paleta(gif, paleta, self.size) if paleta else None
+                        if superficie is not None:
+                            opaco = True
+                        else:
+                            superficie, opaco = _superficie_de_frame(gif, self.size, self.filtro)
+                    if not self._entregar((indice, superficie, opaco)):
+                        break
+                    indice = (indice + 1) % total
+        except Exception as e:
+            print(f"Error en streaming de {self.gif_path}: {e}")
+            self._entregar(None)
+
+    def _entregar(self, elemento):
+        """Espera lugar en la cola; retorna False si se cerró mientras tanto"""
+        while not self._detener.is_set():
+            try:
+                self._cola.put(elemento, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def siguiente(self):
+        """Avanza al próximo frame y lo retorna (solo desde el hilo principal)
+
+        El primer frame se espera hasta ESPERA_PRIMER_FRAME segundos; después, si
+        el hilo se atrasó, se repite el frame actual en lugar de frenar el juego.
+        Retorna None si el GIF no se pudo decodificar.
+        """
+        try:
+            if self.frame_actual is None:
+                elemento = self._cola.get(timeout=ESPERA_PRIMER_FRAME)
+            else:
+                elemento = self._cola.get_nowait()
+        except queue.Empty:
+            if self.frame_actual is not None:
+                self.atrasos += 1
+            return self.frame_actual
+        if elemento is None:
+            return self.frame_actual
+        self.indice, superficie, opaco = elemento
+        if superficie.get_bitsize() == 8:
+            self.frame_actual = superficie  # Con paleta: se dibuja directamente en 8 bits
+        else:
+            self.frame_actual = a_formato_pantalla([superficie], opaco)[0]
+        return self.frame_actual
+
+    def cerrar(self):
+        """Detiene el hilo de decodificación y suelta los frames del anillo"""
+        self._detener.set()
+        while True:
+            try:
+                self._cola.get_nowait()
+            except queue.Empty:
+                break
+        self._hilo.join(timeout=1.0)
+
+
+# ================== PRECARGA EN SEGUNDO PLANO ==================
+
+class PrecargadorRecursos:
+    """Decodifica GIFs en un hilo de fondo y entrega los frames al bucle principal
+
+    FUNCIONAMIENTO DE LA PRECARGA:
+    - solicitar(): encola en el hilo los GIFs que todavía no están en caché
+    - El hilo decodifica y escala, y deja el resultado en una cola
+    - recoger(): desde el bucle principal, pasa los frames terminados al caché
+    - Si algo no terminó a tiempo, load_gif_frames lo carga de forma síncrona
+    """
+    def __init__(self, max_workers=1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="precarga")
+        self._listos = queue.Queue()
+        self._pendientes = {}  # clave -> Future
+
+    def solicitar(self, peticiones):
+        """Encola una lista de (gif_path, size) o (gif_path, size, paleta) para decodificar"""
+        for gif_path, size, *opciones in peticiones:
+            paleta = bool(opciones and opciones[0])
+            clave = clave_cache(gif_path, size, paleta=paleta)
+            if clave in cache_frames or clave in self._pendientes:
+                continue
+            if not os.path.exists(gif_path):
+                continue
+            self._pendientes[clave] = self._executor.submit(self._trabajo, clave, gif_path, size)
+
+    def _trabajo(self, clave, gif_path, size):
+        """Se ejecuta en el hilo de precarga: nunca toca el caché directamente"""
+        try:
+            with traza.tramo("precargar_gif", "carga", gif=gif_path, size=size):
+                if clave[3]:
+                    # None si el GIF tiene transparencia: load_gif_frames lo cargará en RGBA
+                    frames, opaco = _cargar_frames_paleta(gif_path, size), True
+                else:
+                    frames, opaco = _cargar_frames(gif_path, size)
+        except Exception as e:
+            print(f"Error precargando GIF {gif_path}: {e}")
+            frames, opaco = None, None
+        self._listos.put((clave, frames, opaco))
+
+    def recoger(self):
+        """Guarda en el caché los frames ya decodificados; retorna cuántos GIFs llegaron"""
+        recibidos = 0
+        while True:
+            try:
+                clave, frames, opaco = self._listos.get_nowait()
+            except queue.Empty:
+                break
+            self._pendientes.pop(clave, None)
+            # Si ya se cargó de forma síncrona, se descarta el duplicado
+            if frames and clave not in cache_frames:
+                if not clave[3]:
+                    frames = a_formato_pantalla(frames, opaco)
+                cache_frames.guardar(clave, frames)
+                recibidos += 1
+        return recibidos
+
+    def completar(self):
+        """Espera las precargas ya iniciadas y cancela las que no empezaron
+
+        Lo cancelado se cargará después de forma síncrona con load_gif_frames.
+        """
+        for futuro in list(self._pendientes.values()):
+            if not futuro.cancel():
+                futuro.result()
+        self.recoger()
+        self._pendientes.clear()
+
+    def ocupado(self):
+        """True si quedan GIFs en proceso de precarga"""
+        return bool(self._pendientes)
+
+    def cancelar(self):
+        """Cancela las precargas que todavía no empezaron"""
+        for futuro in self._pendientes.values():
+            futuro.cancel()
+        self.recoger()
+        self._pendientes = {clave: futuro for clave, futuro in self._pendientes.items()
+                            if not futuro.cancelled()}
+
+    def cerrar(self):
+        """Detiene el hilo de precarga"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
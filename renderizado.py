@@ -0,0 +1,104 @@
+# ================== RENDERIZADO ==================
+# Archivo separado con las utilidades de dibujo en pantalla
+# Para no repintar los 800x600 píxeles cuando casi nada cambió
+
+from collections import OrderedDict
+
+import pygame
+
+# Máximo de capas translúcidas guardadas (las del mensaje de illas varían de tamaño)
+MAX_CAPAS = 32
+
+
+class RenderizadorRectangulos:
+    """Presenta en pantalla solo las zonas que cambiaron (rectángulos sucios)
+
+    FUNCIONAMIENTO DE LOS RECTÁNGULOS SUCIOS:
+    - Se restaura el fondo estático bajo todo lo que se dibujó el frame anterior
+    - Se dibujan los objetos: cada uno retorna el rectángulo que pintó
+    - Se actualiza la unión de los rectángulos anteriores y actuales
+    - Tras un flip completo (fondo animado, pregunta, mochila) o un cambio de
+      fondo, el siguiente frame repinta el fondo entero una vez
+    """
+    def __init__(self):
+        self.rects_anteriores = []
+        self.valido = False
+        self.fondo = None  # Fondo que está en pantalla bajo los objetos
+
+    def invalidar(self):
+        """La pantalla ya no tiene el fondo estático bajo los objetos"""
+        self.valido = False
+        self.fondo = None
+        self.rects_anteriores = []
+
+    def presentar_completo(self):
+        """Presenta la pantalla entera (modo normal)"""
+        pygame.display.flip()
+        self.invalidar()
+
+    def presentar(self, screen, fondo, dibujar_objetos):
+        """Dibuja los objetos sobre un fondo estático y actualiza solo lo que cambió
+
+        - fondo: superficie estática del tamaño de la pantalla
+        - dibujar_objetos(screen): dibuja y retorna la lista de rectángulos pintados
+        """
+        area = screen.get_rect()
+        if not self.valido or fondo is not self.fondo:
+            self.fondo = fondo
+            screen.blit(fondo, (0, 0))
+            rects = dibujar_objetos(screen)
+            pygame.display.flip()
+            self.valido = True
+        else:
+            for rect in self.rects_anteriores:
+                screen.blit(fondo, rect, rect)
+            rects = dibujar_objetos(screen)
+            actualizar = self.rects_anteriores + [r.clip(area) for r in rects if r]
+            pygame.display.update(actualizar)
+        self.rects_anteriores = [r.clip(area) for r in rects if r]
+
+
+class PoolCapas:
+    """Capas translúcidas de un solo color, creadas una vez y compartidas
+
+    La mochila, las preguntas, las pantallas finales y el mensaje de illas
+    piden su capa por (tamaño, color, alpha) en vez de crear una superficie
+    nueva en cada frame.
+    """
+    def __init__(self, max_capas):
+        self.max_capas = max_capas
+        self._capas = OrderedDict()
+
+    def capa(self, tamano, alpha, color=(0, 0, 0)):
+        """Retorna una superficie de `tamano` rellena de `color` con transparencia `alpha`
+
+        La superficie es compartida: se puede dibujar con ella, pero no modificarla.
+        """
+        clave = (tuple(tamano), tuple(color), alpha)
+        superficie = self._capas.get(clave)
+        if superficie is None:
+            superficie = pygame.Surface(clave[0])
+            superficie.fill(color)
+            superficie.set_alpha(alpha)
+            self._capas[clave] = superficie
+            while len(self._capas) > self.max_capas:
+                self._capas.popitem(last=False)
+        else:
+            self._capas.move_to_end(clave)
+        return superficie
+
+    def limpiar(self):
+        """Libera todas las capas"""
+        self._capas.clear()
+
+    def __len__(self):
+        return len(self._capas)
+
+
+# Pool único del proceso
+pool_capas = PoolCapas(MAX_CAPAS)
+
+
+def capa_translucida(tamano, alpha, color=(0, 0, 0)):
+    """Capa translúcida compartida desde el pool (ver PoolCapas.capa)"""
+    return pool_capas.capa(tamano, alpha, color)
@@ -0,0 +1,189 @@
+# ================== SIMULACIÓN SIN PANTALLA ==================
+# Archivo separado con el modo headless del juego
+# Corre GameManager sin ventana ni audio (drivers "dummy" de SDL) y con la
+# entrada generada tick a tick por un piloto automático, tan rápido como se pueda
+#
+# USO: python simulacion.py                 (partida completa, dibujando cada tick)
+#      python simulacion.py --solo-logica   (sin dibujar, solo la simulación)
+#      python simulacion.py --ticks 5000    (límite de ticks de la partida)
+#      python simulacion.py --verboso       (muestra los mensajes del juego)
+#      python simulacion.py --grabar x.ekr  (graba la partida, ver grabacion.py)
+#      python simulacion.py --traza t.json  (traza para Perfetto, ver traza.py)
+
+import os
+
+# Sin ventana ni audio: debe definirse antes de importar jugar (que abre la pantalla)
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import argparse
+import contextlib
+import io
+import time
+
+import pygame
+
+import jugar
+import traza
+
+# Límite de ticks por defecto (una partida completa dura unos 4.000)
+MAX_TICKS = 20000
+
+ESTADOS_FINALES = ("GAME_OVER", "VICTORY")
+
+
+class EstadoTeclas:
+    """Reemplazo de pygame.key.get_pressed(): teclas presionadas en el tick actual"""
+    def __init__(self, presionadas=()):
+        self.presionadas = set(presionadas)
+
+    def __getitem__(self, tecla):
+        return tecla in self.presionadas
+
+
+def evento_tecla(tecla):
+    """Evento KEYDOWN sintético, igual al que genera el teclado"""
+    return pygame.event.Event(pygame.KEYDOWN, key=tecla, mod=0, unicode="", scancode=0)
+
+
+class PilotoAutomatico:
+    """Política guionada que juega una partida completa
+
+    EN CADA TICK (entrada):
+    - MENÚ: elige JUGAR
+    - PREGUNTA: mueve la selección hasta la respuesta correcta y confirma;
+      cuando termina el tiempo del resultado, presiona una tecla para cerrarla
+    - ESCENA: camina hacia el Apu, luego hacia cada illa pendiente y al final al portal
+    """
+    def entrada(self, game):
+        """Retorna (teclas presionadas, eventos) para el tick actual"""
+        if game.game_state == "MENU":
+            menu = game.main_menu
+            if menu.options[menu.selected_option] == "JUGAR":
+                return set(), [evento_tecla(pygame.K_RETURN)]
+            return set(), [evento_tecla(pygame.K_UP)]
+        if game.game_state != "PLAYING":
+            return set(), []
+
+        escena = game.scenes[game.current_scene]
+        if escena.showing_question and escena.question_screen:
+            return set(), self._responder(escena.question_screen)
+
+        return self._caminar_hacia(game.player, self._objetivo(escena)), []
+
+    def _responder(self, pregunta):
+        """Eventos para contestar correctamente una pregunta"""
+        if not pregunta.answered:
+            correcta = pregunta.pregunta_data["respuesta_correcta"]
+            if pregunta.selected_option < correcta:
+                return [evento_tecla(pygame.K_DOWN)]
+            if pregunta.selected_option > correcta:
+                return [evento_tecla(pygame.K_UP)]
+            return [evento_tecla(pygame.K_RETURN)]
+        if pregunta.is_finished():
+            # La pregunta solo se cierra al recibir un evento después del resultado
+            return [evento_tecla(pygame.K_SPACE)]
+        return []
+
+    def _objetivo(self, escena):
+        """Coordenada x a la que debe ir Ekeko"""
+        if not escena.completed:
+            return escena.apu.rect.centerx
+        pendientes = [articulo for articulo in escena.artikulos_visuales if not articulo.collected]
+        if pendientes:
+            return pendientes[0].rect.centerx
+        return escena.portal.rect.centerx
+
+    def _caminar_hacia(self, player, objetivo_x):
+        """Teclas para acercarse a una coordenada x"""
+        distancia = objetivo_x - player.rect.centerx
+        if distancia > player.speed:
+            return {pygame.K_d}
+        if distancia < -player.speed:
+            return {pygame.K_a}
+        return set()
+
+
+def crear_juego(verboso=False):
+    """Crea un GameManager (silenciando sus mensajes salvo que se pida lo contrario)"""
+    salida = contextlib.nullcontext() if verboso else contextlib.redirect_stdout(io.StringIO())
+    with salida:
+        return jugar.GameManager()
+
+
+def ejecutar(game, piloto, max_ticks=MAX_TICKS, dibujar=True, verboso=False,
+             parar_al_terminar=True, grabador=None):
+    """Corre la partida tick a tick con la entrada del piloto
+
+    - parar_al_terminar: detenerse al llegar a GAME_OVER o VICTORY
+    - grabador: GrabadorEntrada que anota la entrada de cada tick (opcional)
+
+    Retorna un diccionario con el resultado y la velocidad (ticks por segundo).
+    """
+    teclas = EstadoTeclas()
+    game.leer_teclas = lambda: teclas
+    if grabador:
+        grabador.conectar(game)
+    ticks = 0
+    salida = contextlib.nullcontext() if verboso else contextlib.redirect_stdout(io.StringIO())
+    inicio = time.perf_counter()
+    with salida:
+        while ticks < max_ticks:
+            if parar_al_terminar and game.game_state in ESTADOS_FINALES:
+                break
+            presionadas, eventos = piloto.entrada(game)
+            teclas.presionadas = presionadas
+            for evento in eventos:
+                game.handle_event(evento)
+            with traza.tramo("update", "frame"):
+                game.simular(1)
+            if dibujar:
+                with traza.tramo("draw", "frame", estado=game.game_state):
+                    game.render(jugar.screen)
+            ticks += 1
+    segundos = time.perf_counter() - inicio
+    return {
+        "estado": game.game_state,
+        "escena": game.current_scene + 1,
+        "illas": len(game.player.articulos_collected),
+        "ticks": ticks,
+        "segundos": segundos,
+        "ticks_por_segundo": ticks / segundos if segundos else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulación sin pantalla de La Travesía de Ekeko")
+    parser.add_argument("--ticks", type=int, default=MAX_TICKS, help="máximo de ticks a simular")
+    parser.add_argument("--solo-logica", action="store_true", help="no dibujar, solo simular")
+    parser.add_argument("--verboso", action="store_true", help="mostrar los mensajes del juego")
+    parser.add_argument("--grabar", metavar="RUTA", help="grabar la entrada de la partida")
+    parser.add_argument("--traza", metavar="RUTA", help="guardar una traza Chrome/Perfetto")
+    args = parser.parse_args()
+
+    if args.traza:
+        traza.iniciar(args.traza)
+
+    grabador = None
+    if args.grabar:
+        from grabacion import GrabadorEntrada
+        grabador = GrabadorEntrada()
+
+    game = crear_juego(args.verboso)
+    resultado = ejecutar(game, PilotoAutomatico(), args.ticks,
+                         dibujar=not args.solo_logica, verboso=args.verboso, grabador=grabador)
+    if grabador:
+        grabador.guardar(args.grabar)
+    game.cerrar()
+    if traza.activa:
+        traza.guardar()
+    pygame.quit()
+
+    print(f"🤖 Partida simulada: {resultado['estado']} en la escena {resultado['escena']}/14, "
+          f"{resultado['illas']}/19 illas")
+    print(f"⏱️ {resultado['ticks']} ticks en {resultado['segundos']:.2f} s "
+          f"-> {resultado['ticks_por_segundo']:.0f} ticks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# ================== CACHÉ DE TEXTOS ==================
+# Archivo separado con el caché de textos renderizados
+# Los textos del HUD casi nunca cambian: se rasterizan una vez y se reutilizan
+
+from collections import OrderedDict
+
+import pygame
+
+# Máximo de superficies de texto guardadas
+MAX_TEXTOS = 256
+
+
+class CacheTextos:
+    """Caché LRU de superficies de texto
+
+    CLAVE: (fuente, texto, color, antialias) y, para textos con sombra,
+    además (color de sombra, desplazamiento)
+    """
+    def __init__(self, max_textos):
+        self.max_textos = max_textos
+        self._entradas = OrderedDict()
+
+    def obtener(self, clave):
+        """Retorna la superficie guardada o None si no está en caché"""
+        superficie = self._entradas.get(clave)
+        if superficie is None:
+            return None
+        self._entradas.move_to_end(clave)
+        return superficie
+
+    def guardar(self, clave, superficie):
+        """Guarda una superficie y descarta la menos usada si se supera el máximo"""
+        self._entradas[clave] = superficie
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.max_textos:
+            self._entradas.popitem(last=False)
+
+    def limpiar(self):
+        """Vacía el caché por completo"""
+        self._entradas.clear()
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+# Caché único del proceso
+cache_textos = CacheTextos(MAX_TEXTOS)
+
+
+def render_text(font, text, color, antialias=True):
+    """Equivalente a font.render(text, antialias, color) pero desde el caché"""
+    clave = (font, text, tuple(color), antialias)
+    superficie = cache_textos.obtener(clave)
+    if superficie is None:
+        superficie = font.render(text, antialias, color)
+        cache_textos.guardar(clave, superficie)
+    return superficie
+
+
+def render_text_shadow(font, text, color, shadow_color=(0, 0, 0), offset=(2, 2), antialias=True):
+    """Renderiza un texto con sombra en una sola superficie
+
+    La superficie tiene margen a ambos lados, así que su centro coincide con el
+    centro del texto: get_rect(center=...) ubica el texto igual que antes y la
+    sombra queda desplazada por `offset`.
+    """
+    clave = (font, text, tuple(color), antialias, tuple(shadow_color), tuple(offset))
+    superficie = cache_textos.obtener(clave)
+    if superficie is None:
+        texto = font.render(text, antialias, color)
+        sombra = font.render(text, antialias, shadow_color)
+        dx, dy = offset
+        superficie = pygame.Surface((texto.get_width() + 2 * abs(dx),
+                                     texto.get_height() + 2 * abs(dy)), pygame.SRCALPHA)
+        superficie.blit(sombra, (abs(dx) + dx, abs(dy) + dy))
+        superficie.blit(texto, (abs(dx), abs(dy)))
+        cache_textos.guardar(clave, superficie)
+    return superficie
@@ -0,0 +1,112 @@
+# ================== TRAZA DE SESIÓN (CHROME TRACE / PERFETTO) ==================
+# Archivo separado con la captura de eventos de una sesión completa
+# Registra cargas de GIFs y música, cambios de escena, preguntas y los tramos
+# de cada frame en formato Chrome Trace Event (JSON), que se abre en
+# https://ui.perfetto.dev o en chrome://tracing
+#
+# Apagada por defecto: cada punto de medición solo consulta `activa` y usa un
+# contexto vacío compartido, así que sin traza el costo es casi nulo
+#
+# USO: python jugar.py --traza sesion.json
+#      python simulacion.py --traza sesion.json
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+activa = False
+
+_eventos = []
+_hilos = {}  # tid -> nombre del hilo
+_inicio = 0.0
+_ruta = None
+_NULO = contextlib.nullcontext()
+
+
+def _microsegundos(instante):
+    return (instante - _inicio) * 1_000_000
+
+
+def _hilo_actual():
+    tid = threading.get_ident()
+    if tid not in _hilos:
+        _hilos[tid] = threading.current_thread().name
+    return tid
+
+
+class _Tramo:
+    """Evento completo ("X"): desde __enter__ hasta __exit__"""
+    __slots__ = ("nombre", "categoria", "args", "inicio")
+
+    def __init__(self, nombre, categoria, args):
+        self.nombre = nombre
+        self.categoria = categoria
+        self.args = args
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        fin = time.perf_counter()
+        evento = {
+            "name": self.nombre, "cat": self.categoria, "ph": "X",
+            "ts": _microsegundos(self.inicio), "dur": (fin - self.inicio) * 1_000_000,
+            "pid": os.getpid(), "tid": _hilo_actual(),
+        }
+        if self.args:
+            evento["args"] = self.args
+        _eventos.append(evento)  # append es atómico: sirve también desde los hilos de precarga
+        return False
+
+
+def tramo(nombre, categoria="juego", **args):
+    """Contexto que registra un tramo con duración (no hace nada si la traza está apagada)"""
+    if not activa:
+        return _NULO
+    return _Tramo(nombre, categoria, args)
+
+
+def instante(nombre, categoria="juego", **args):
+    """Registra un evento puntual (pregunta abierta, escena nueva...)"""
+    if not activa:
+        return
+    evento = {
+        "name": nombre, "cat": categoria, "ph": "i", "s": "t",
+        "ts": _microsegundos(time.perf_counter()), "pid": os.getpid(), "tid": _hilo_actual(),
+    }
+    if args:
+        evento["args"] = args
+    _eventos.append(evento)
+
+
+def iniciar(ruta):
+    """Empieza a registrar eventos; guardar() los escribe en `ruta`"""
+    global activa, _inicio, _ruta
+    _eventos.clear()
+    _hilos.clear()
+    _inicio = time.perf_counter()
+    _ruta = ruta
+    activa = True
+    print(f"🧵 Traza activa: se guardará en {ruta}")
+
+
+def guardar():
+    """Detiene la traza y escribe el JSON; retorna la cantidad de eventos"""
+    global activa
+    activa = False
+    if _ruta is None:
+        return 0
+    pid = os.getpid()
+    metadatos = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                  "args": {"name": "La Travesía de Ekeko"}}]
+    for tid, nombre in _hilos.items():
+        metadatos.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                          "args": {"name": nombre}})
+    eventos = list(_eventos)
+    with open(_ruta, "w", encoding="utf-8") as archivo:
+        json.dump({"traceEvents": metadatos + eventos, "displayTimeUnit": "ms"}, archivo)
+    print(f"🧵 Traza guardada: {_ruta} ({len(eventos)} eventos)")
+    return len(eventos)